@@ -0,0 +1,4 @@
+# 게시판 백엔드 부하 테스트 / 벤치마크
+#
+#   python -m benchmarks run --scenario all --backend memory --output before.json
+#   python -m benchmarks compare before.json after.json
@@ -0,0 +1,183 @@
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime
+
+# board-backend 디렉터리에서 실행한다고 가정 (main.py 의 static 경로가 상대 경로)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except Exception:
+        return ""
+
+
+async def _run(args) -> dict:
+    import httpx
+    import loop_watchdog
+    import main
+    from benchmarks import dataset
+    from benchmarks.loadgen import run_scenario
+    from benchmarks.scenarios import SCENARIOS
+
+    if args.target and args.loop_budget_ms:
+        raise SystemExit("--loop-budget-ms 는 프로세스 내부 실행에서만 사용할 수 있습니다.")
+    if args.target and args.backend != "mongo":
+        raise SystemExit("--target 은 --backend mongo 와 함께 사용해야 합니다 (서버와 같은 DB에 데이터를 넣어야 함).")
+
+    names = list(SCENARIOS) if args.scenario == "all" else args.scenario.split(",")
+    for name in names:
+        if name not in SCENARIOS:
+            raise SystemExit(f"알 수 없는 시나리오: {name} (가능: {', '.join(SCENARIOS)})")
+
+    client = dataset.connect(args.backend, args.mongo_url, args.db)
+    data = await dataset.seed(args.seed, args.posts, args.comments, args.users, args.scores)
+    # ASGITransport 는 startup 이벤트를 실행하지 않으므로 인덱스를 직접 생성
+    await main.create_indexes()
+
+    watchdog_task = None
+    if args.loop_budget_ms:
+        # 예산보다 오래 이벤트 루프를 막는 요청을 기록 (heartbeat 는 예산보다 촘촘하게)
+        budget = args.loop_budget_ms / 1000
+        watchdog = loop_watchdog.LoopWatchdog(interval=min(0.01, budget / 2), threshold=budget)
+        watchdog_task = asyncio.create_task(watchdog.run())
+
+    results = {}
+    if args.target:
+        # 이미 실행 중인 서버 (serve.py) 대상. 서버도 같은 MONGO_DB 를 사용해야 함
+        limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+        http_client = httpx.AsyncClient(base_url=args.target, limits=limits, timeout=30.0)
+    else:
+        http_client = httpx.AsyncClient(transport=httpx.ASGITransport(app=main.app), base_url="http://bench")
+    async with http_client as http:
+        for name in names:
+            print(f"[{name}] concurrency={args.concurrency} duration={args.duration}s ...", flush=True)
+            result = await run_scenario(
+                http, SCENARIOS[name], data,
+                concurrency=args.concurrency, duration=args.duration,
+                warmup=args.warmup, seed=args.seed,
+            )
+            results[name] = result
+            print(
+                f"    {result['throughput_rps']:.1f} req/s  "
+                f"p50={result['p50_ms']:.2f}ms p95={result['p95_ms']:.2f}ms p99={result['p99_ms']:.2f}ms  "
+                f"errors={result['errors']}"
+            )
+
+    loop_stalls = []
+    if watchdog_task is not None:
+        watchdog_task.cancel()
+        await asyncio.gather(watchdog_task, return_exceptions=True)
+        loop_stalls = list(watchdog.recent)
+
+    if args.backend == "mongo":
+        await client.drop_database(args.db)
+
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "backend": args.backend,
+            "target": args.target or "in-process",
+            "seed": args.seed,
+            "dataset": {"posts": args.posts, "comments_per_post": args.comments, "users": args.users, "scores": args.scores},
+        },
+        "results": results,
+        "loop_stalls": loop_stalls,
+    }
+
+
+def _compare(before_path: str, after_path: str):
+    with open(before_path, encoding="utf-8") as f:
+        before = json.load(f)["results"]
+    with open(after_path, encoding="utf-8") as f:
+        after = json.load(f)["results"]
+
+    def delta(old, new):
+        return f"{(new - old) / old * 100:+.1f}%" if old else "n/a"
+
+    print(f"{'scenario':<14}{'metric':<16}{'before':>12}{'after':>12}{'change':>10}")
+    for name in before:
+        if name not in after:
+            continue
+        for metric in ("throughput_rps", "p50_ms", "p95_ms", "p99_ms"):
+            old, new = before[name][metric], after[name][metric]
+            print(f"{name:<14}{metric:<16}{old:>12.2f}{new:>12.2f}{delta(old, new):>10}")
+
+
+def _check_loop_budget(report: dict, budget_ms: float) -> bool:
+    # 요청이나 콜백(task 없이 실행된 call_soon 등)에 귀속된 stall 이 하나라도 있으면 실패.
+    # 하네스 자체의 background stall, 메모리 백엔드(mongomock 은 쿼리를 루프 스레드에서 바로 실행하지만
+    # 실제 Motor 는 스레드 풀에서 실행)의 stall 은 참고용으로만 출력
+    worst = {}
+    first_failure = None
+    for stall in report["loop_stalls"]:
+        fake_db = any("mongomock" in line for line in stall["stack"])
+        counted = stall["route"] != "background" and not fake_db
+        key = (counted, stall["method"] or stall["task"], stall["route"])
+        worst[key] = max(worst.get(key, 0.0), stall["seconds"])
+        if counted and first_failure is None:
+            first_failure = stall
+
+    print(f"\n이벤트 루프 예산 {budget_ms:.0f}ms")
+    for (counted, method, route), seconds in sorted(worst.items(), key=lambda item: (not item[0][0], -item[1])):
+        print(f"    {'FAIL' if counted else 'info'}  {method} {route}  최대 {seconds * 1000:.1f}ms")
+    if first_failure is None:
+        print("    OK")
+        return True
+    print(f"\n{first_failure['method']} {first_failure['route']} ({first_failure['seconds'] * 1000:.1f}ms):")
+    print("".join(first_failure["stack"][-8:]), end="")
+    return False
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="게시판 백엔드 벤치마크")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="시나리오 실행")
+    run.add_argument("--scenario", default="all", help="all 또는 쉼표로 구분한 시나리오 이름")
+    run.add_argument("--backend", choices=["memory", "mongo"], default="memory")
+    run.add_argument("--mongo-url", default="mongodb://localhost:27017")
+    run.add_argument("--db", default="board_benchmark", help="벤치마크 전용 데이터베이스 이름")
+    run.add_argument("--concurrency", type=int, default=32)
+    run.add_argument("--duration", type=float, default=10.0)
+    run.add_argument("--warmup", type=float, default=2.0)
+    run.add_argument("--seed", type=int, default=42)
+    run.add_argument("--posts", type=int, default=200)
+    run.add_argument("--comments", type=int, default=20, help="게시글당 댓글 수")
+    run.add_argument("--users", type=int, default=100)
+    run.add_argument("--scores", type=int, default=5000)
+    run.add_argument("--target", help="실행 중인 서버 주소 (예: http://localhost:8000). 생략하면 프로세스 내부에서 호출")
+    run.add_argument("--output", help="결과 JSON 저장 경로")
+    run.add_argument("--loop-budget-ms", type=float, default=0,
+                     help="요청이 이벤트 루프를 이 시간 이상 막으면 종료 코드 1 (CI 용, 0 이면 검사 안 함)")
+
+    compare = sub.add_parser("compare", help="두 결과 JSON 비교")
+    compare.add_argument("before")
+    compare.add_argument("after")
+
+    args = parser.parse_args()
+    if args.command == "compare":
+        _compare(args.before, args.after)
+        return
+
+    report = asyncio.run(_run(args))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+    if args.loop_budget_ms and not _check_loop_budget(report, args.loop_budget_ms):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
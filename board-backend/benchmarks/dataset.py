@@ -0,0 +1,114 @@
+import random
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+
+import main
+
+GAME_NAMES = ["watermelon", "alicepang", "AntCompany"]
+CATEGORIES = ["Unity 게임", "Three.js 게임", "시뮬레이터"]
+BENCH_PASSWORD = "bench-password"
+
+
+# 벤치마크용 컬렉션을 main 모듈에 연결 (실제 board_database는 건드리지 않음)
+def use_database(client, db_name: str):
+    main.client = client
+    main.db = client[db_name]
+    main.posts_collection = main.db.posts
+    main.users_collection = main.db.users
+    main.comments_collection = main.db.comments
+    main.scores_collection = main.db.scores
+    main.score_summaries_collection = main.db.score_summaries
+    main.trending_collection = main.db.trending
+
+
+def connect(backend: str, mongo_url: str, db_name: str):
+    if backend == "memory":
+        try:
+            from mongomock_motor import AsyncMongoMockClient
+        except ImportError:
+            raise SystemExit("--backend memory 를 사용하려면 `pip install mongomock-motor` 가 필요합니다.")
+        client = AsyncMongoMockClient()
+    else:
+        from motor.motor_asyncio import AsyncIOMotorClient
+        client = AsyncIOMotorClient(mongo_url)
+    use_database(client, db_name)
+    return client
+
+
+# 시드 고정 데이터 생성 (같은 시드면 같은 데이터)
+async def seed(seed: int, posts: int, comments_per_post: int, users: int, scores: int) -> dict:
+    rng = random.Random(seed)
+    for collection in (main.posts_collection, main.users_collection,
+                       main.comments_collection, main.scores_collection):
+        await collection.delete_many({})
+
+    # bcrypt 해시는 한 번만 계산해서 모든 사용자에게 재사용
+    hashed_password = main.get_password_hash(BENCH_PASSWORD)
+    user_ids = [f"bench_user_{i}" for i in range(users)]
+    await main.users_collection.insert_many([
+        {
+            "userid": userid,
+            "email": f"{userid}@bench.local",
+            "password": hashed_password,
+            "gender": rng.choice(["male", "female"]),
+            "birthdate": "2000-01-01",
+            "created_at": datetime(2024, 1, 1),
+            "profile_image": "/images/profile.jpg",
+        }
+        for userid in user_ids
+    ])
+
+    base_date = datetime(2024, 1, 1)
+    post_docs = [
+        {
+            "_id": ObjectId(),
+            "title": f"벤치마크 게임 {i}",
+            "author": rng.choice(user_ids),
+            "content": "벤치마크용 게시글 본문입니다. " * 5,
+            "category": rng.choice(CATEGORIES),
+            "thumbnail": None,
+            "webgl_path": f"/games/{rng.choice(GAME_NAMES)}/index.html",
+            "date": (base_date + timedelta(days=i)).strftime("%Y-%m-%d"),
+            "created_at": base_date + timedelta(days=i),
+            "views": rng.randint(0, 1000),
+        }
+        for i in range(posts)
+    ]
+    if post_docs:
+        await main.posts_collection.insert_many(post_docs)
+    post_ids = [str(post["_id"]) for post in post_docs]
+
+    comment_docs = [
+        {
+            "post_id": post_id,
+            "author": rng.choice(user_ids),
+            "content": f"댓글 {j}",
+            "date": (base_date + timedelta(minutes=j)).strftime("%Y-%m-%d %H:%M"),
+            "created_at": base_date + timedelta(minutes=j),
+        }
+        for post_id in post_ids
+        for j in range(comments_per_post)
+    ]
+    if comment_docs:
+        await main.comments_collection.insert_many(comment_docs)
+
+    score_docs = [
+        {
+            "game_name": rng.choice(GAME_NAMES),
+            "score": rng.randint(0, 100000),
+            "username": rng.choice(user_ids),
+            "date": (base_date + timedelta(seconds=i)).strftime("%Y-%m-%d %H:%M:%S"),
+            "created_at": base_date + timedelta(seconds=i),
+        }
+        for i in range(scores)
+    ]
+    if score_docs:
+        await main.scores_collection.insert_many(score_docs)
+
+    return {
+        "post_ids": post_ids,
+        "user_ids": user_ids,
+        "tokens": {userid: main.create_access_token(data={"sub": userid}) for userid in user_ids},
+        "game_names": GAME_NAMES,
+    }
@@ -0,0 +1,63 @@
+import asyncio
+import math
+import random
+import time
+
+
+def percentile(sorted_values, p: float) -> float:
+    # nearest-rank 방식
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, math.ceil(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+# concurrency 개의 워커가 duration 초 동안 시나리오를 반복 실행
+async def run_scenario(client, scenario, data, concurrency: int, duration: float, warmup: float, seed: int) -> dict:
+    latencies = []
+    errors = 0
+    error_samples = []
+    loop = time.perf_counter
+    measure_from = loop() + warmup
+    deadline = measure_from + duration
+
+    async def worker(index: int):
+        nonlocal errors
+        rng = random.Random(seed * 1000 + index)
+        while True:
+            start = loop()
+            if start >= deadline:
+                return
+            try:
+                await scenario(client, rng, data)
+                failed = False
+            except Exception as e:
+                failed = True
+                if len(error_samples) < 5:
+                    error_samples.append(str(e))
+            if start >= measure_from:
+                if failed:
+                    errors += 1
+                else:
+                    latencies.append(loop() - start)
+            # 실제 클라이언트처럼 요청 사이에 이벤트 루프에 양보
+            # (메모리 백엔드는 I/O 없이 끝나서, 양보하지 않으면 다른 태스크가 실행되지 않음)
+            await asyncio.sleep(0)
+
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+
+    latencies.sort()
+    completed = len(latencies)
+    return {
+        "concurrency": concurrency,
+        "duration_s": duration,
+        "requests": completed,
+        "errors": errors,
+        "error_samples": error_samples,
+        "throughput_rps": completed / duration if duration else 0.0,
+        "mean_ms": sum(latencies) / completed * 1000 if completed else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "max_ms": latencies[-1] * 1000 if latencies else 0.0,
+    }
@@ -0,0 +1,51 @@
+# 시나리오 하나 = 사용자 동작 한 번 (여러 요청일 수 있음)
+# 실패 시 예외를 던지고, 성공하면 None 을 반환
+
+
+def _check(response):
+    if response.status_code >= 400:
+        raise RuntimeError(f"{response.request.method} {response.request.url.path} -> {response.status_code}")
+    return response
+
+
+# 홈페이지 게시글 목록
+async def browse(client, rng, data):
+    _check(await client.get("/api/posts"))
+
+
+# 게시글 상세 + 댓글
+async def read_post(client, rng, data):
+    post_id = rng.choice(data["post_ids"])
+    _check(await client.get(f"/api/posts/{post_id}"))
+    _check(await client.get(f"/api/posts/{post_id}/comments"))
+
+
+# 로그인 폭주 (bcrypt 검증 비용 포함)
+async def login_storm(client, rng, data):
+    from benchmarks.dataset import BENCH_PASSWORD
+    userid = rng.choice(data["user_ids"])
+    _check(await client.post("/api/auth/login", json={"userid": userid, "password": BENCH_PASSWORD}))
+
+
+# 게임 종료 후 점수 저장 폭주
+async def score_burst(client, rng, data):
+    userid = rng.choice(data["user_ids"])
+    _check(await client.post(
+        "/api/scores",
+        json={"game_name": rng.choice(data["game_names"]), "score": rng.randint(0, 100000), "username": userid},
+        headers={"Authorization": f"Bearer {data['tokens'][userid]}"},
+    ))
+
+
+# 리더보드 폴링
+async def leaderboard(client, rng, data):
+    _check(await client.get(f"/api/scores/{rng.choice(data['game_names'])}"))
+
+
+SCENARIOS = {
+    "browse": browse,
+    "read_post": read_post,
+    "login_storm": login_storm,
+    "score_burst": score_burst,
+    "leaderboard": leaderboard,
+}
@@ -0,0 +1,80 @@
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+# 1,000개 게시글 목록 직렬화 비교
+#   before: 문서별 dict 헬퍼 + jsonable_encoder + json.dumps (FastAPI 기본 경로)
+#   after : 미리 만든 변환기 + orjson.dumps
+#   python -m benchmarks.serialization
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+
+import main
+
+
+def _legacy_post_helper(post, comment_count):
+    category = post.get("category", "Unity 게임")
+    default_thumbnail = "/images/three.png" if category == "Three.js 게임" else "/images/unity.jpg"
+    return {
+        "id": str(post["_id"]),
+        "title": post["title"],
+        "author": post["author"],
+        "content": post["content"],
+        "category": category,
+        "thumbnail": post.get("thumbnail", default_thumbnail),
+        "webgl_path": post.get("webgl_path", ""),
+        "date": post["date"],
+        "views": post["views"],
+        "comment_count": comment_count,
+    }
+
+
+def _before(posts):
+    rows = [_legacy_post_helper(post, 3) for post in posts]
+    return json.dumps(jsonable_encoder(rows), ensure_ascii=False, allow_nan=False,
+                      indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def _after(posts):
+    return main.ORJSONResponse([main.post_row(post, 3) for post in posts]).body
+
+
+def _time(fn, posts, repeat: int) -> float:
+    fn(posts)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(posts)
+    return (time.perf_counter() - start) / repeat
+
+
+def run(count: int = 1000, repeat: int = 50):
+    base_date = datetime(2024, 1, 1)
+    posts = [
+        {
+            "_id": ObjectId(),
+            "title": f"벤치마크 게임 {i}",
+            "author": "bench_user",
+            "content": "벤치마크용 게시글 본문입니다. " * 5,
+            "category": "Unity 게임",
+            "webgl_path": "/games/watermelon/index.html",
+            "date": (base_date + timedelta(days=i)).strftime("%Y-%m-%d"),
+            "views": i,
+        }
+        for i in range(count)
+    ]
+    before_body, after_body = _before(posts), _after(posts)
+    assert json.loads(before_body) == json.loads(after_body)
+
+    before_s, after_s = _time(_before, posts, repeat), _time(_after, posts, repeat)
+    print(f"{count} posts, {repeat} runs")
+    print(f"  before: {before_s * 1000:8.2f} ms  {len(before_body):>9} bytes")
+    print(f"  after : {after_s * 1000:8.2f} ms  {len(after_body):>9} bytes  ({before_s / after_s:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    run()
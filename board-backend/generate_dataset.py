@@ -0,0 +1,304 @@
+import argparse
+import asyncio
+import itertools
+import math
+import os
+import random
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+import bcrypt
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from create_sample_posts import SAMPLE_POSTS
+
+# 대용량 합성 데이터 생성기
+#   python generate_dataset.py --users 1000000 --posts 1000000 --comments 5000000 --scores 10000000 --drop
+#
+# 데이터는 CHUNK_SIZE 개씩 나뉘고, 각 청크는 (seed, 컬렉션, 청크 번호)로 만든 RNG 로 생성된다.
+# 따라서 --processes / --concurrency 와 상관없이 같은 --seed 면 같은 데이터(_id 포함)가 만들어진다.
+
+CHUNK_SIZE = 10000
+
+GAME_NAMES = ["watermelon", "alicepang", "AntCompany"]
+GAME_WEIGHTS = [0.6, 0.3, 0.1]
+GENERATED_PASSWORD = "password1234"
+
+# 한국어 본문 생성을 위한 단어 목록
+KOREAN_WORDS = (
+    "게임 정말 재미있어요 점수 최고 기록 도전 다시 한번 해봐야겠네요 난이도 조금 어려워요 "
+    "그래픽 예뻐요 음악 좋아요 친구 함께 플레이 했습니다 업데이트 기대됩니다 버그 있어요 "
+    "스테이지 보스 아이템 캐릭터 레벨 랭킹 일위 목표 오늘 어제 주말 밤새 계속 너무 진짜 "
+    "최고예요 감사합니다 추천합니다 수박 과일 합치기 개미 회사 앨리스 퍼즐 타워 쌓기"
+).split()
+
+DATE_END = datetime(2025, 1, 1)
+
+
+# Zipf 분포 누적 가중치 (소수의 인기 게시글 / 헤비 플레이어에 몰리도록), 프로세스마다 한 번만 계산
+@lru_cache(maxsize=None)
+def zipf_cum_weights(n: int, s: float = 1.1):
+    return list(itertools.accumulate(1.0 / (rank ** s) for rank in range(1, n + 1)))
+
+
+@lru_cache(maxsize=None)
+def day_strings(days: int):
+    start = DATE_END - timedelta(days=days)
+    return [(start + timedelta(days=d)).strftime("%Y-%m-%d") for d in range(days + 31)]
+
+
+def start_time(days: int) -> datetime:
+    return DATE_END - timedelta(days=days)
+
+
+def start_epoch(days: int) -> int:
+    # 타임존과 상관없이 같은 _id 가 나오도록 UTC 기준
+    return int((DATE_END - timedelta(days=days)).replace(tzinfo=timezone.utc).timestamp())
+
+
+# 시드와 순번으로 결정되는 ObjectId (타임스탬프 4바이트 + 순번 8바이트)
+def deterministic_id(epoch: int, index: int) -> ObjectId:
+    return ObjectId(struct.pack(">IQ", epoch, index))
+
+
+def format_time(days: int, offset: int, seconds: bool) -> str:
+    # 시작 시점으로부터 offset 초 뒤를 "%Y-%m-%d %H:%M[:%S]" 형식으로 (strftime 보다 빠름)
+    day, rest = divmod(offset, 86400)
+    hour, rest = divmod(rest, 3600)
+    minute, second = divmod(rest, 60)
+    if seconds:
+        return f"{day_strings(days)[day]} {hour:02d}:{minute:02d}:{second:02d}"
+    return f"{day_strings(days)[day]} {hour:02d}:{minute:02d}"
+
+
+def korean_text(rng: random.Random, min_words: int, max_words: int) -> str:
+    return " ".join(rng.choices(KOREAN_WORDS, k=rng.randint(min_words, max_words)))
+
+
+def user_id(index: int) -> str:
+    return f"user{index:07d}"
+
+
+def pick_users(rng: random.Random, users: int, k: int):
+    return rng.choices(range(users), cum_weights=zipf_cum_weights(users), k=k)
+
+
+def post_offset(index: int, p: dict) -> int:
+    # 게시글은 순번 순서대로 날짜가 증가하도록 배치 (_id 정렬 == 작성일 정렬)
+    return index * p["days"] * 86400 // max(1, p["posts"])
+
+
+def post_rank_to_index(rank: int, posts: int) -> int:
+    # 인기 순위 -> 게시글 순번 (최신 글만 인기 있지 않도록 서로소 곱셈으로 섞음)
+    multiplier = 7919
+    while math.gcd(multiplier, posts) != 1:
+        multiplier += 2
+    return rank * multiplier % posts
+
+
+@lru_cache(maxsize=None)
+def password_hash() -> str:
+    # bcrypt 해시는 프로세스마다 한 번만 계산해서 재사용 (모든 사용자 비밀번호 동일)
+    return bcrypt.hashpw(GENERATED_PASSWORD.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+
+
+def make_users(rng: random.Random, start: int, end: int, p: dict):
+    epoch = start_epoch(p["days"])
+    hashed_password = password_hash()
+    docs = []
+    for i in range(start, end):
+        offset = rng.randrange(p["days"] * 86400)
+        userid = user_id(i)
+        docs.append({
+            "_id": deterministic_id(epoch + offset, i),
+            "userid": userid,
+            "email": f"{userid}@example.com",
+            "password": hashed_password,
+            "gender": "male" if rng.random() < 0.5 else "female",
+            "birthdate": f"{rng.randint(1970, 2010)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            "created_at": start_time(p["days"]) + timedelta(seconds=offset),
+            "profile_image": "/images/profile.jpg",
+        })
+    return docs
+
+
+def make_posts(rng: random.Random, start: int, end: int, p: dict):
+    epoch = start_epoch(p["days"])
+    days = day_strings(p["days"])
+    authors = pick_users(rng, p["users"], end - start)
+    games = rng.choices(GAME_NAMES, weights=GAME_WEIGHTS, k=end - start)
+    docs = []
+    for i, author, game in zip(range(start, end), authors, games):
+        template = SAMPLE_POSTS[i % len(SAMPLE_POSTS)]
+        offset = post_offset(i, p)
+        docs.append({
+            "_id": deterministic_id(epoch + offset, i),
+            "title": f"{template['title']} #{i}",
+            "author": user_id(author),
+            "content": template["content"] + " " + korean_text(rng, 5, 40),
+            "category": template["category"],
+            "thumbnail": template["thumbnail"],
+            "webgl_path": f"/games/{game}/index.html",
+            "date": days[offset // 86400],
+            "created_at": start_time(p["days"]) + timedelta(seconds=offset),
+            # 꼬리가 긴 분포: 대부분 조회수가 낮고 일부 게시글만 매우 높음
+            "views": int(rng.paretovariate(1.2) * 10),
+        })
+    return docs
+
+
+def make_comments(rng: random.Random, start: int, end: int, p: dict):
+    epoch = start_epoch(p["days"])
+    posts = p["posts"]
+    # 인기 게시글에 댓글이 몰리도록 Zipf 가중치로 순위를 고름
+    ranks = rng.choices(range(posts), cum_weights=zipf_cum_weights(posts), k=end - start)
+    authors = pick_users(rng, p["users"], end - start)
+    docs = []
+    for i, rank, author in zip(range(start, end), ranks, authors):
+        post_index = post_rank_to_index(rank, posts)
+        post_start = post_offset(post_index, p)
+        offset = post_start + rng.randrange(30 * 86400)
+        docs.append({
+            "_id": deterministic_id(epoch + offset, i),
+            "post_id": str(deterministic_id(epoch + post_start, post_index)),
+            "author": user_id(author),
+            "content": korean_text(rng, 2, 20),
+            "date": format_time(p["days"], offset, seconds=False),
+            "created_at": start_time(p["days"]) + timedelta(seconds=offset),
+        })
+    return docs
+
+
+def make_scores(rng: random.Random, start: int, end: int, p: dict):
+    epoch = start_epoch(p["days"])
+    span = p["days"] * 86400
+    # 헤비 플레이어에게 점수 기록이 몰리도록 Zipf 가중치 사용
+    players = pick_users(rng, p["users"], end - start)
+    games = rng.choices(GAME_NAMES, weights=GAME_WEIGHTS, k=end - start)
+    docs = []
+    for i, player, game in zip(range(start, end), players, games):
+        offset = rng.randrange(span)
+        docs.append({
+            "_id": deterministic_id(epoch + offset, i),
+            "game_name": game,
+            "score": int(rng.lognormvariate(8, 1.2)),
+            "username": user_id(player),
+            "date": format_time(p["days"], offset, seconds=True),
+            "created_at": start_time(p["days"]) + timedelta(seconds=offset),
+        })
+    return docs
+
+
+GENERATORS = {
+    "users": make_users,
+    "posts": make_posts,
+    "comments": make_comments,
+    "scores": make_scores,
+}
+
+
+async def _load_chunks(name: str, chunks, p: dict) -> int:
+    client = AsyncIOMotorClient(p["mongo_url"])
+    collection = client[p["db"]][name]
+    semaphore = asyncio.Semaphore(p["concurrency"])
+    tasks = []
+    inserted = 0
+
+    async def insert(batch):
+        try:
+            if not p["dry_run"]:
+                await collection.insert_many(batch, ordered=False, bypass_document_validation=True)
+        finally:
+            semaphore.release()
+
+    for chunk in chunks:
+        start = chunk * CHUNK_SIZE
+        end = min(start + CHUNK_SIZE, p["counts"][name])
+        rng = random.Random(f"{p['seed']}:{name}:{chunk}")
+        batch = GENERATORS[name](rng, start, end, p)
+        await semaphore.acquire()
+        tasks.append(asyncio.create_task(insert(batch)))
+        inserted += len(batch)
+
+    await asyncio.gather(*tasks)
+    client.close()
+    return inserted
+
+
+# 워커 프로세스 진입점 (프로세스마다 자신의 Motor 클라이언트를 만듦)
+def load_worker(name: str, chunks, p: dict) -> int:
+    return asyncio.run(_load_chunks(name, chunks, p))
+
+
+async def drop_collections(mongo_url: str, db_name: str):
+    # 컬렉션을 지우면 인덱스도 사라지므로 적재가 빠름 (인덱스는 서버 시작 시 다시 생성됨)
+    client = AsyncIOMotorClient(mongo_url)
+    for name in GENERATORS:
+        await client[db_name].drop_collection(name)
+    client.close()
+
+
+def generate(args):
+    if args.drop and not args.dry_run:
+        asyncio.run(drop_collections(args.mongo_url, args.db))
+
+    p = {
+        "mongo_url": args.mongo_url,
+        "db": args.db,
+        "seed": args.seed,
+        "days": args.days,
+        "users": max(1, args.users),
+        "posts": max(1, args.posts),
+        "concurrency": args.concurrency,
+        "dry_run": args.dry_run,
+        "counts": {
+            "users": args.users,
+            "posts": args.posts,
+            "comments": args.comments if args.posts > 0 else 0,
+            "scores": args.scores,
+        },
+    }
+
+    total_docs = 0
+    total_start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.processes) as pool:
+        for name in GENERATORS:
+            count = p["counts"][name]
+            if count <= 0:
+                continue
+            chunk_count = math.ceil(count / CHUNK_SIZE)
+            # 청크를 워커에 번갈아 배분
+            shards = [list(range(i, chunk_count, args.processes)) for i in range(min(args.processes, chunk_count))]
+            start = time.perf_counter()
+            inserted = sum(pool.map(load_worker, itertools.repeat(name), shards, itertools.repeat(p)))
+            elapsed = time.perf_counter() - start
+            total_docs += inserted
+            print(f"[OK] {name}: {inserted:,}개 ({elapsed:.1f}s, {inserted / elapsed:,.0f} docs/s)", flush=True)
+
+    elapsed = time.perf_counter() - total_start
+    print(f"\n총 {total_docs:,}개 문서, {elapsed:.1f}s ({total_docs / elapsed if elapsed else 0:,.0f} docs/s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대용량 합성 데이터 생성기")
+    parser.add_argument("--mongo-url", default="mongodb://localhost:27017")
+    parser.add_argument("--db", default="board_database")
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--posts", type=int, default=50000)
+    parser.add_argument("--comments", type=int, default=500000)
+    parser.add_argument("--scores", type=int, default=1000000)
+    parser.add_argument("--days", type=int, default=365, help="데이터가 분포할 기간 (일)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1, help="생성/적재 워커 프로세스 수")
+    parser.add_argument("--concurrency", type=int, default=4, help="프로세스당 동시에 진행할 insert_many 개수")
+    parser.add_argument("--drop", action="store_true", help="적재 전에 users/posts/comments/scores 컬렉션 삭제")
+    parser.add_argument("--dry-run", action="store_true", help="DB에 쓰지 않고 생성 속도만 측정")
+    generate(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
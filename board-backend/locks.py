@@ -0,0 +1,28 @@
+import os
+import socket
+from datetime import datetime, timedelta
+
+from pymongo.errors import DuplicateKeyError
+
+# 여러 워커(프로세스) 중 하나만 작업을 실행하도록 만료 시간이 있는 잠금 (locks 컬렉션, _id = 잠금 이름)
+
+
+async def acquire_lock(locks, name: str, owner: str, lease_seconds: float) -> bool:
+    now = datetime.utcnow()
+    try:
+        await locks.update_one(
+            {"_id": name, "$or": [{"expires_at": {"$lt": now}}, {"owner": owner}]},
+            {"$set": {"owner": owner, "expires_at": now + timedelta(seconds=lease_seconds)}},
+            upsert=True
+        )
+        return True
+    except DuplicateKeyError:
+        return False
+
+
+async def release_lock(locks, name: str, owner: str):
+    await locks.delete_one({"_id": name, "owner": owner})
+
+
+def lock_owner() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
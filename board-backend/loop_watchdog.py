@@ -0,0 +1,117 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+
+import metrics
+from profiling import IDLE_FRAMES, LOOP_FRAMES
+
+# 이벤트 루프 지연(lag) 측정 / 느린 콜백 감시
+#
+# - heartbeat 코루틴이 interval 마다 깨어나면서, 예정보다 늦게 깨어난 시간(lag)을 히스토그램에 기록한다.
+# - 별도 스레드가 짧은 간격으로 이벤트 루프 스레드를 들여다보며, 같은 task 가 루프를 계속 점유하는 시간을 잰다.
+#   threshold 를 넘기는 순간(=아직 막혀 있는 동안) 스택을 잡고, task 가 처리 중인 요청의 라우트에 귀속시킨다.
+#   task 없이 도는 콜백(call_soon / call_later 등)이 막은 경우는 그 콜백(Handle) 단위로 재서 "callback" 라우트로 남긴다.
+# - 작은 콜백 여러 개가 쌓여서 생긴 지연은 stall 로 세지 않고 lag 히스토그램에만 나타난다.
+
+MAX_RECENT_STALLS = 50
+MAX_STACK_DEPTH = 40
+
+
+class LoopWatchdog:
+    def __init__(self, interval: float = 0.05, threshold: float = 0.1):
+        self.interval = interval
+        self.threshold = threshold
+        # 점유 시간 측정 오차가 threshold 보다 충분히 작도록
+        self.poll = min(interval, threshold) / 4
+        self.recent = deque(maxlen=MAX_RECENT_STALLS)
+        self.loop = None
+        self.loop_thread_id = None
+        self.task = None
+        self._stop = threading.Event()
+
+    async def run(self):
+        self.loop = asyncio.get_running_loop()
+        self.loop_thread_id = threading.get_ident()
+        self.task = asyncio.current_task()
+        self._stop.clear()
+        thread = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        thread.start()
+        try:
+            while True:
+                due = time.monotonic() + self.interval
+                await asyncio.sleep(self.interval)
+                metrics.event_loop_lag.observe(max(0.0, time.monotonic() - due))
+        finally:
+            # 감시 스레드는 poll 안에 스스로 끝남 (루프에서 join 하면 그동안 루프가 막힘)
+            self._stop.set()
+
+    def _watch(self):
+        current = None   # 루프를 점유 중인 task, task 가 없으면 실행 중인 콜백의 Handle
+        started = 0.0
+        stall = None     # threshold 를 넘겨서 잡아 둔 정보
+        while True:
+            stopped = self._stop.wait(self.poll)
+            now = time.monotonic()
+            owner = task = frame = None
+            if not stopped:
+                frame = sys._current_frames().get(self.loop_thread_id)
+                if frame is not None and (os.path.basename(frame.f_code.co_filename), frame.f_code.co_name) not in IDLE_FRAMES:
+                    task = asyncio.current_task(self.loop)
+                    owner = task if task is not None else _running_handle(frame)
+
+            if owner is not current or owner is None:
+                if stall is not None:
+                    # 직전 관측과 이번 관측 사이 어딘가에서 끝났으므로 중간값으로 추정
+                    self._record(stall, now - self.poll / 2 - stall["started"])
+                current, started, stall = owner, now - self.poll / 2, None
+            elif stall is None and owner is not self.task and now - started >= self.threshold:
+                stall = {
+                    "started": started,
+                    "task": task.get_name() if task is not None else None,
+                    "callback": None if task is not None else repr(owner),
+                    "scope": metrics.active_requests.get(task) if task is not None else None,
+                    "stack": traceback.format_list(traceback.extract_stack(frame, MAX_STACK_DEPTH)),
+                }
+            if stopped:
+                return
+
+    def _record(self, stall: dict, seconds: float):
+        scope = stall["scope"]
+        method = path = task = None
+        if scope is not None:
+            route, method, path = metrics.route_template(scope), scope["method"], scope["path"]
+        elif stall["callback"] is not None:
+            # task 없이 실행된 콜백
+            route, task = "callback", stall["callback"]
+        else:
+            # 요청이 아닌 task (lifespan 백그라운드 작업 등)
+            route, task = "background", stall["task"]
+        stack = stall["stack"]
+
+        metrics.add_loop_stall(route, seconds)
+        self.recent.append({
+            "time": time.time(),
+            "seconds": round(seconds, 4),
+            "route": route,
+            "method": method,
+            "path": path,
+            "task": task,
+            "stack": stack,
+        })
+        where = stack[-1].strip().splitlines()[0] if stack else "?"
+        print(f"[loop-watchdog] event loop blocked {seconds * 1000:.0f}ms in {method or task} {route} at {where}")
+
+
+# 루프 스레드에서 실행 중인 Handle (콜백). 찾지 못하면 프레임 객체로 대신 구분
+def _running_handle(frame):
+    current = frame
+    while current is not None:
+        code = current.f_code
+        if (os.path.basename(code.co_filename), code.co_name) in LOOP_FRAMES:
+            return current.f_locals.get("self", current)
+        current = current.f_back
+    return frame
@@ -1,13 +1,16 @@
-from fastapi import FastAPI, HTTPException, Depends, status
+from fastapi import FastAPI, HTTPException, Depends, Query, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.staticfiles import StaticFiles
+from fastapi.responses import PlainTextResponse, JSONResponse, Response, StreamingResponse
 from motor.motor_asyncio import AsyncIOMotorClient
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime, timedelta
+from contextlib import asynccontextmanager
 from bson import ObjectId
 import jwt
+import orjson
 import bcrypt
 import random
 import string
@@ -15,6 +18,21 @@ import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import mimetypes
+import csv
+import io
+import re
+import os
+import time
+import asyncio
+import heapq
+import metrics
+import score_retention
+import trending
+import migrations
+import profile_images
+import profiling
+import loop_watchdog
+from migrations import POST_DATE_FORMAT, COMMENT_DATE_FORMAT, SCORE_DATE_FORMAT
 
 # Unity WebGL을 위한 MIME 타입 설정
 mimetypes.add_type('application/wasm', '.wasm')
@@ -22,7 +40,96 @@ mimetypes.add_type('application/octet-stream', '.data')
 mimetypes.add_type('application/javascript', '.framework.js')
 mimetypes.add_type('application/javascript', '.loader.js')
 
-app = FastAPI()
+# MongoDB 설정 (워커 프로세스마다 lifespan 안에서 클라이언트를 생성)
+MONGO_URL = os.environ.get("MONGO_URL", "mongodb://localhost:27017")
+MONGO_DB = os.environ.get("MONGO_DB", "board_database")
+MONGO_MAX_POOL_SIZE = int(os.environ.get("MONGO_MAX_POOL_SIZE", "100"))
+MONGO_MIN_POOL_SIZE = int(os.environ.get("MONGO_MIN_POOL_SIZE", "0"))
+MONGO_SERVER_SELECTION_TIMEOUT_MS = int(os.environ.get("MONGO_SERVER_SELECTION_TIMEOUT_MS", "5000"))
+MONGO_CONNECT_TIMEOUT_MS = int(os.environ.get("MONGO_CONNECT_TIMEOUT_MS", "5000"))
+MONGO_SOCKET_TIMEOUT_MS = int(os.environ.get("MONGO_SOCKET_TIMEOUT_MS", "30000"))
+
+# 콜드 스타트 목표 시간 (초과 시 경고 로그)
+STARTUP_TARGET_SECONDS = float(os.environ.get("STARTUP_TARGET_SECONDS", "5"))
+
+# 점수 보관 정책: 오래된 원본 점수는 사용자/게임별 요약으로 합친 뒤 삭제
+SCORE_RETENTION_DAYS = float(os.environ.get("SCORE_RETENTION_DAYS", "90"))
+SCORE_ROLLUP_INTERVAL_SECONDS = float(os.environ.get("SCORE_ROLLUP_INTERVAL_SECONDS", "3600"))  # 0 이면 비활성화
+SCORE_ROLLUP_BATCH_SIZE = int(os.environ.get("SCORE_ROLLUP_BATCH_SIZE", "1000"))
+SCORE_ROLLUP_PAUSE_SECONDS = float(os.environ.get("SCORE_ROLLUP_PAUSE_SECONDS", "0.1"))
+
+# 온라인 마이그레이션 (문자열 date -> datetime created_at 백필) 배치 크기/간격
+MIGRATION_BATCH_SIZE = int(os.environ.get("MIGRATION_BATCH_SIZE", "1000"))
+MIGRATION_PAUSE_SECONDS = float(os.environ.get("MIGRATION_PAUSE_SECONDS", "0.1"))
+
+# 인기 게임(게시글) 순위: 반감기, 유지할 상위 개수, Mongo 동기화 주기, 이벤트별 가중치
+TRENDING_HALF_LIFE_HOURS = float(os.environ.get("TRENDING_HALF_LIFE_HOURS", "24"))
+TRENDING_TOP_K = int(os.environ.get("TRENDING_TOP_K", "100"))
+TRENDING_SYNC_SECONDS = float(os.environ.get("TRENDING_SYNC_SECONDS", "15"))
+TRENDING_VIEW_WEIGHT = 1.0
+TRENDING_COMMENT_WEIGHT = 3.0
+TRENDING_SCORE_WEIGHT = 0.5
+# 게임별 대표 게시글 캐시 유지 시간 (초)
+GAME_POSTS_REFRESH_SECONDS = 60
+
+trending_tracker = trending.TrendingTracker(TRENDING_HALF_LIFE_HOURS * 3600, TRENDING_TOP_K)
+
+# 이벤트 루프 지연 감시: heartbeat 간격, 이 시간 이상 루프가 막히면 스택과 라우트를 기록
+LOOP_WATCHDOG_INTERVAL_MS = float(os.environ.get("LOOP_WATCHDOG_INTERVAL_MS", "50"))  # 0 이면 비활성화
+LOOP_STALL_THRESHOLD_MS = float(os.environ.get("LOOP_STALL_THRESHOLD_MS", "100"))
+
+loop_watchdog_monitor = loop_watchdog.LoopWatchdog(LOOP_WATCHDOG_INTERVAL_MS / 1000, LOOP_STALL_THRESHOLD_MS / 1000)
+
+# 필수 단계는 lifespan 시작 중에, 나머지 warm-up 은 서빙을 시작한 뒤 백그라운드로 진행
+# 그 warm-up 이 끝나야 /readyz 가 200 을 반환 (그동안 /healthz 는 응답)
+is_ready = False
+
+async def sync_trending_periodically():
+    while True:
+        await asyncio.sleep(TRENDING_SYNC_SECONDS)
+        try:
+            await trending_tracker.sync(trending_collection)
+        except Exception as e:
+            print(f"[trending] sync failed: {e}")
+
+def start_background_tasks() -> list:
+    tasks = [
+        asyncio.create_task(sync_trending_periodically()),
+        asyncio.create_task(migrations.run_in_background(
+            db, MIGRATION_BATCH_SIZE, MIGRATION_PAUSE_SECONDS
+        )),
+    ]
+    if LOOP_WATCHDOG_INTERVAL_MS > 0:
+        tasks.append(asyncio.create_task(loop_watchdog_monitor.run()))
+    if SCORE_ROLLUP_INTERVAL_SECONDS > 0:
+        tasks.append(asyncio.create_task(score_retention.run_periodically(
+            db, SCORE_ROLLUP_INTERVAL_SECONDS, SCORE_RETENTION_DAYS,
+            SCORE_ROLLUP_BATCH_SIZE, SCORE_ROLLUP_PAUSE_SECONDS
+        )))
+    return tasks
+
+@asynccontextmanager
+async def lifespan(app):
+    global is_ready
+    is_ready = False
+    total_start = time.perf_counter()
+    await warm_up()
+    background_tasks = start_background_tasks()
+    # 이 태스크는 lifespan 시작이 끝나고 uvicorn 이 요청을 받기 시작한 뒤에 진행됨
+    background_tasks.append(asyncio.create_task(finish_warm_up(total_start)))
+    yield
+    is_ready = False
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    # 아직 반영되지 않은 인기 점수 증가분 저장
+    try:
+        await trending_tracker.sync(trending_collection)
+    except Exception as e:
+        print(f"[trending] final sync failed: {e}")
+    close_db()
+
+app = FastAPI(lifespan=lifespan)
 
 # Custom StaticFiles class with proper MIME types
 class UnityStaticFiles(StaticFiles):
@@ -43,6 +150,13 @@ class UnityStaticFiles(StaticFiles):
 
         return response
 
+# orjson으로 바로 직렬화하는 응답 (jsonable_encoder 를 거치지 않음)
+class ORJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
 # Static 파일 서빙 설정
 app.mount("/images", StaticFiles(directory="static/images"), name="images")
 app.mount("/games", UnityStaticFiles(directory="static/games", html=True), name="games")
@@ -70,13 +184,135 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# MongoDB 연결
-client = AsyncIOMotorClient("mongodb://localhost:27017")
-db = client.board_database
-posts_collection = db.posts
-users_collection = db.users
-comments_collection = db.comments
-scores_collection = db.scores
+# 라우트별 지연 시간 / Mongo 명령 / 정적 파일 전송량 수집
+app.add_middleware(metrics.MetricsMiddleware)
+
+# 관리자가 켠 경우에만 동작하는 온디맨드 프로파일러 (꺼져 있으면 그대로 통과)
+app.add_middleware(profiling.ProfilingMiddleware)
+
+# MongoDB 연결 (connect_db 호출 전까지는 None)
+client = None
+db = None
+posts_collection = None
+users_collection = None
+comments_collection = None
+scores_collection = None
+score_summaries_collection = None
+trending_collection = None
+
+def connect_db():
+    global client, db, posts_collection, users_collection, comments_collection, scores_collection
+    global score_summaries_collection, trending_collection
+    # fork 이후 각 워커에서 호출되어야 함 (fork 이전에 만든 클라이언트는 공유하면 안 됨)
+    client = AsyncIOMotorClient(
+        MONGO_URL,
+        maxPoolSize=MONGO_MAX_POOL_SIZE,
+        minPoolSize=MONGO_MIN_POOL_SIZE,
+        serverSelectionTimeoutMS=MONGO_SERVER_SELECTION_TIMEOUT_MS,
+        connectTimeoutMS=MONGO_CONNECT_TIMEOUT_MS,
+        socketTimeoutMS=MONGO_SOCKET_TIMEOUT_MS,
+        event_listeners=[metrics.mongo_listener],
+    )
+    db = client[MONGO_DB]
+    posts_collection = db.posts
+    users_collection = db.users
+    comments_collection = db.comments
+    scores_collection = db.scores
+    score_summaries_collection = db.score_summaries
+    trending_collection = db.trending
+
+def close_db():
+    if client is not None:
+        client.close()
+
+# 게시글 목록 페이지네이션 설정
+POST_PAGE_DEFAULT = 100
+POST_PAGE_MAX = 200
+
+# 댓글 페이지네이션 설정
+COMMENT_PAGE_MAX = 100
+COMMENT_PAGE_DEFAULT = 50
+COMMENT_BATCH_MAX_POSTS = 50
+
+async def create_indexes():
+    # 게시글별 댓글을 _id 순으로 키셋 페이지네이션하기 위한 인덱스
+    await comments_collection.create_index([("post_id", 1), ("_id", 1)])
+    # 게임별 게시글 조회 (webgl_path 접두 검색)
+    await posts_collection.create_index("webgl_path")
+    # 스코어보드 (게임별 점수 내림차순), 사용자별 점수 조회
+    await scores_collection.create_index([("game_name", 1), ("score", -1)])
+    await scores_collection.create_index([("username", 1), ("date", -1)])
+    await scores_collection.create_index([("username", 1), ("created_at", -1)])
+    # 점수 요약 (사용자/게임별 1건), 요약 스코어보드
+    await score_summaries_collection.create_index([("username", 1), ("game_name", 1)], unique=True)
+    await score_summaries_collection.create_index([("game_name", 1), ("best", -1)])
+    # 인기 순위 상위 K 개 조회
+    await trending_collection.create_index([("epoch", 1), ("score", -1)])
+    # 최근 프로파일 목록
+    await db.profiles.create_index([("started_at", -1)])
+    # 로그인 / 회원가입 중복 체크 / 아이디 찾기
+    await users_collection.create_index("userid")
+    await users_collection.create_index("email")
+
+async def _warm_mongo_pool():
+    # 첫 요청이 연결 비용을 내지 않도록 최소 풀 크기만큼 연결을 미리 열어 둠
+    await asyncio.gather(*(client.admin.command("ping") for _ in range(max(1, MONGO_MIN_POOL_SIZE))))
+
+async def _warm_code_paths():
+    # 첫 bcrypt / JWT / Pydantic 검증 비용을 미리 지불
+    hashed = await asyncio.to_thread(get_password_hash, "warm-up")
+    await asyncio.to_thread(verify_password, "warm-up", hashed)
+    token = create_access_token(data={"sub": "warm-up"})
+    jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    UserLogin(userid="warm-up", password="warm-up")
+    GameScore(game_name="warm-up", score=0, username="warm-up")
+
+async def _warm_hot_reads():
+    # 홈페이지 게시글 목록과 게임별 상위 스코어보드를 미리 읽어 캐시를 데움
+    await get_posts(limit=POST_PAGE_DEFAULT)
+    for game_name in await scores_collection.distinct("game_name"):
+        await get_scoreboard(game_name)
+
+# (단계 이름, 함수) 목록을 순서대로 실행
+# required 단계가 실패하면 시작을 중단하고, 나머지는 건너뛰고 계속
+async def _run_phases(phases, required: bool):
+    for name, phase in phases:
+        start = time.perf_counter()
+        try:
+            await phase()
+        except Exception as e:
+            if required:
+                print(f"[startup] {name} failed: {e}")
+                raise
+            print(f"[startup] {name} skipped: {e}")
+        elapsed = time.perf_counter() - start
+        metrics.startup_phases[name] = elapsed
+        print(f"[startup] {name}: {elapsed * 1000:.1f}ms")
+
+# 서빙 전에 반드시 끝나야 하는 단계 (lifespan 시작 중에 실행)
+async def warm_up():
+    connect_db()
+    await _run_phases([
+        ("mongo_pool", _warm_mongo_pool),
+        ("indexes", create_indexes),
+    ], required=True)
+
+# 서빙을 시작한 뒤 백그라운드에서 실행하고, 끝나면 ready 로 전환
+async def finish_warm_up(total_start: float):
+    global is_ready
+    await _run_phases([
+        ("code_paths", _warm_code_paths),
+        ("hot_reads", _warm_hot_reads),
+        ("trending", lambda: trending_tracker.sync(trending_collection)),
+    ], required=False)
+
+    total = time.perf_counter() - total_start
+    metrics.startup_phases["total"] = total
+    if total > STARTUP_TARGET_SECONDS:
+        print(f"[startup] WARNING: warm-up took {total:.2f}s (target {STARTUP_TARGET_SECONDS:.2f}s)")
+    else:
+        print(f"[startup] ready in {total:.2f}s")
+    is_ready = True
 
 # Pydantic 모델
 class User(BaseModel):
@@ -136,6 +372,7 @@ class GameScore(BaseModel):
     username: str
 
 # 유틸리티 함수
+# bcrypt / SMTP 는 이벤트 루프를 막으므로 async 핸들러에서는 asyncio.to_thread 로 호출
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     # 비밀번호 검증
     return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
@@ -202,41 +439,152 @@ def send_email(to_email: str, subject: str, body: str):
         print(f"Email sending failed: {e}")
         return False
 
+# 읽기 쿼리 projection (응답에 필요한 필드만 가져옴)
+POST_PROJECTION = {"title": 1, "author": 1, "content": 1, "category": 1, "thumbnail": 1,
+                   "webgl_path": 1, "date": 1, "created_at": 1, "views": 1}
+COMMENT_PROJECTION = {"post_id": 1, "author": 1, "content": 1, "date": 1, "created_at": 1}
+SCOREBOARD_PROJECTION = {"username": 1, "score": 1, "date": 1, "created_at": 1}
+USER_SCORE_PROJECTION = {"game_name": 1, "score": 1, "date": 1, "created_at": 1}
+SUMMARY_PROJECTION = {"username": 1, "game_name": 1, "best": 1, "best_date": 1, "count": 1, "last_played": 1}
+ME_PROJECTION = {"_id": 0, "userid": 1, "email": 1, "gender": 1, "birthdate": 1,
+                 "created_at": 1, "profile_image": 1, "profile_image_small": 1}
+
+# 문서 -> 응답 행 변환기
+# (출력 키, 문서 키, 기본값) 목록을 한 번만 튜플로 고정해 두고 모든 문서에 재사용
+# date_format 이 있으면 created_at(datetime)이 있는 문서는 그 값으로 date 를 만들고,
+# 아직 마이그레이션되지 않은 문서는 기존 문자열 date 를 그대로 사용 (응답 형식은 동일)
+# convert.columns 는 행의 키 순서 (CSV 헤더용)
+def make_converter(fields, date_format: Optional[str] = None):
+    fields = tuple(fields)
+
+    def convert(doc) -> dict:
+        row = {"id": str(doc["_id"])}
+        for out_key, doc_key, default in fields:
+            row[out_key] = doc.get(doc_key, default)
+        if date_format is not None:
+            created_at = doc.get("created_at")
+            if created_at is not None:
+                row["date"] = created_at.strftime(date_format)
+        return row
+
+    convert.columns = ("id",) + tuple(out_key for out_key, _, _ in fields)
+    return convert
+
+_post_row = make_converter([
+    ("title", "title", ""),
+    ("author", "author", ""),
+    ("content", "content", ""),
+    ("category", "category", "Unity 게임"),
+    ("thumbnail", "thumbnail", None),
+    ("webgl_path", "webgl_path", ""),
+    ("date", "date", ""),
+    ("views", "views", 0),
+], POST_DATE_FORMAT)
+comment_helper = make_converter([
+    ("post_id", "post_id", ""),
+    ("author", "author", ""),
+    ("content", "content", ""),
+    ("date", "date", ""),
+], COMMENT_DATE_FORMAT)
+scoreboard_row = make_converter([
+    ("username", "username", ""),
+    ("score", "score", 0),
+    ("date", "date", ""),
+], SCORE_DATE_FORMAT)
+user_score_row = make_converter([
+    ("game_name", "game_name", ""),
+    ("score", "score", 0),
+    ("date", "date", ""),
+], SCORE_DATE_FORMAT)
+
+summary_scoreboard_row = make_converter([
+    ("username", "username", ""),
+    ("score", "best", 0),
+    ("date", "best_date", ""),
+])
+# 요약 행: 롤업된 기간의 최고 점수와 플레이 횟수, 마지막 플레이 시각
+summary_user_score_row = make_converter([
+    ("game_name", "game_name", ""),
+    ("score", "best", 0),
+    ("date", "last_played", ""),
+    ("count", "count", 0),
+])
+
+def post_row(post, comment_count: int) -> dict:
+    row = _post_row(post)
+    # 썸네일 필드가 없는 게시글은 카테고리별 기본 썸네일 사용
+    if "thumbnail" not in post:
+        row["thumbnail"] = "/images/three.png" if row["category"] == "Three.js 게임" else "/images/unity.jpg"
+    row["comment_count"] = comment_count
+    return row
+
+# 여러 게시글의 댓글 수를 한 번의 집계로 계산 ({post_id: 댓글 수})
+# 호출하는 쪽은 한 페이지(POST_PAGE_MAX, TRENDING_TOP_K 이하) 분량의 id 만 넘긴다
+async def get_comment_counts(post_ids: List[str]) -> dict:
+    counts = {}
+    pipeline = [
+        {"$match": {"post_id": {"$in": post_ids}}},
+        {"$group": {"_id": "$post_id", "count": {"$sum": 1}}},
+    ]
+    async for row in comments_collection.aggregate(pipeline):
+        counts[row["_id"]] = row["count"]
+    return counts
+
+def game_name_from_path(webgl_path: str) -> Optional[str]:
+    parts = (webgl_path or "").split("/")
+    if len(parts) > 2 and parts[1] == "games" and parts[2]:
+        return parts[2]
+    return None
+
+def game_path_query(game_name: str) -> dict:
+    # webgl_path 가 /games/{게임 이름}/... 인 게시글 (접두 정규식이라 webgl_path 인덱스를 탐)
+    return {"webgl_path": {"$regex": f"^/games/{re.escape(game_name)}/"}}
+
+# 게임 이름 -> (대표 게시글 id, 읽은 시각)
+# 점수 기록의 인기 점수는 게임마다 대표 게시글(그 게임을 처음 올린 게시글) 하나에만 반영한다.
+# 같은 게임의 게시글이 수십만 개여도 점수 저장 한 번은 record() 한 번으로 끝난다.
+# game_name 은 클라이언트가 임의로 보낼 수 있으므로 게시글이 있는 게임만 캐시 (크기는 게임 수로 제한됨)
+game_canonical_posts = {}
+
+async def get_game_post_id(game_name: str) -> Optional[str]:
+    cached = game_canonical_posts.get(game_name)
+    if cached is not None and time.monotonic() - cached[1] < GAME_POSTS_REFRESH_SECONDS:
+        return cached[0]
+    post = await posts_collection.find_one(game_path_query(game_name), {"_id": 1}, sort=[("_id", 1)])
+    if post is None:
+        game_canonical_posts.pop(game_name, None)
+        return None
+    post_id = str(post["_id"])
+    game_canonical_posts[game_name] = (post_id, time.monotonic())
+    return post_id
+
 # ObjectId를 문자열로 변환하는 헬퍼 함수
 async def post_helper(post) -> dict:
     # 댓글 수 계산
     comment_count = await comments_collection.count_documents({"post_id": str(post["_id"])})
-
-    # 카테고리별 기본 썸네일 설정
-    category = post.get("category", "Unity 게임")
-    default_thumbnail = "/images/three.png" if category == "Three.js 게임" else "/images/unity.jpg"
-
-    return {
-        "id": str(post["_id"]),
-        "title": post["title"],
-        "author": post["author"],
-        "content": post["content"],
-        "category": category,
-        "thumbnail": post.get("thumbnail", default_thumbnail),
-        "webgl_path": post.get("webgl_path", ""),
-        "date": post["date"],
-        "views": post["views"],
-        "comment_count": comment_count
-    }
-
-def comment_helper(comment) -> dict:
-    return {
-        "id": str(comment["_id"]),
-        "post_id": comment["post_id"],
-        "author": comment["author"],
-        "content": comment["content"],
-        "date": comment["date"]
-    }
+    return post_row(post, comment_count)
 
 @app.get("/")
 async def root():
     return {"message": "Board API Server"}
 
+# liveness (프로세스가 살아 있으면 항상 200)
+@app.get("/healthz")
+async def healthz():
+    return {"status": "ok"}
+
+# readiness (warm-up 완료 후에만 200)
+@app.get("/readyz")
+async def readyz():
+    if not is_ready:
+        return JSONResponse(status_code=503, content={"status": "starting"})
+    return {"status": "ready", "startup_seconds": metrics.startup_phases}
+
+# Prometheus 메트릭
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
 # 회원가입
 @app.post("/api/auth/register")
 async def register(user: User):
@@ -251,7 +599,7 @@ async def register(user: User):
         raise HTTPException(status_code=400, detail="Email already registered")
 
     # 비밀번호 해싱
-    hashed_password = get_password_hash(user.password)
+    hashed_password = await asyncio.to_thread(get_password_hash, user.password)
 
     # 사용자 저장
     user_dict = {
@@ -289,7 +637,7 @@ async def login(user: UserLogin):
         raise HTTPException(status_code=401, detail="Incorrect userid or password")
 
     # 비밀번호 확인
-    if not verify_password(user.password, db_user["password"]):
+    if not await asyncio.to_thread(verify_password, user.password, db_user["password"]):
         raise HTTPException(status_code=401, detail="Incorrect userid or password")
 
     # JWT 토큰 생성
@@ -323,7 +671,7 @@ async def get_me(
             "is_admin": True
         }
 
-    user = await users_collection.find_one({"userid": userid})
+    user = await users_collection.find_one({"userid": userid}, ME_PROJECTION)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
@@ -332,15 +680,65 @@ async def get_me(
     if created_at and isinstance(created_at, datetime):
         created_at = created_at.isoformat()
 
-    return {
+    return ORJSONResponse({
         "userid": user["userid"],
         "email": user["email"],
         "gender": user.get("gender", ""),
         "birthdate": user.get("birthdate", ""),
         "created_at": created_at,
         "profile_image": user.get("profile_image", "/images/profile.jpg"),
+        "profile_image_small": user.get("profile_image_small", user.get("profile_image", "/images/profile.jpg")),
         "is_admin": False
-    }
+    })
+
+# 프로필 이미지 업로드 (multipart, 작은/큰 크기 WebP 로 저장하고 사용자 문서에는 경로만 저장)
+@app.post("/api/auth/profile-image")
+async def upload_profile_image(request: Request, userid: str = Depends(get_current_user)):
+    # UploadFile 을 쓰면 핸들러 실행 전에 본문 전체가 임시 파일로 파싱되므로, 본문은 직접 스트리밍으로 읽음.
+    # Content-Length 가 있으면 본문을 읽기 전에 거르고, 없으면 받는 도중에 크기 제한을 확인
+    content_length = request.headers.get("content-length")
+    if content_length and int(content_length) > profile_images.PROFILE_IMAGE_MAX_BYTES + profile_images.MULTIPART_OVERHEAD_BYTES:
+        raise HTTPException(status_code=413, detail="이미지 파일은 5MB 이하만 업로드할 수 있습니다.")
+
+    loop = asyncio.get_running_loop()
+    spool = None
+    tmp_path = None
+    try:
+        spool = profile_images.UploadSpool(request.headers.get("content-type", ""))
+        async for chunk in request.stream():
+            if chunk:
+                await loop.run_in_executor(profile_images.upload_executor, spool.write, chunk)
+        tmp_path, digest, _ = await loop.run_in_executor(profile_images.upload_executor, spool.finish)
+        urls = await loop.run_in_executor(
+            profile_images.image_executor, profile_images.store_variants, tmp_path, digest
+        )
+    except profile_images.ImageTooLarge:
+        raise HTTPException(status_code=413, detail="이미지 파일은 5MB 이하만 업로드할 수 있습니다.")
+    except profile_images.InvalidImage:
+        raise HTTPException(status_code=400, detail="지원하지 않는 이미지 파일입니다. (JPEG, PNG, WebP, GIF)")
+    finally:
+        # store_variants 까지 가지 못한 경우 임시 파일 정리
+        if spool is not None and tmp_path is None:
+            spool.abort()
+
+    await users_collection.update_one(
+        {"userid": userid},
+        {"$set": {"profile_image": urls["large"], "profile_image_small": urls["small"]}}
+    )
+    return {"profile_image": urls["large"], "profile_image_small": urls["small"]}
+
+# 프로필 이미지 URL 변경 (data: URL 등 긴 문자열은 받지 않음)
+@app.post("/api/auth/update-profile-image")
+async def update_profile_image(request: UpdateProfileImageRequest, userid: str = Depends(get_current_user)):
+    profile_image = request.profile_image.strip()
+    if len(profile_image) > 512 or not profile_image.startswith(("http://", "https://", "/images/")):
+        raise HTTPException(status_code=400, detail="프로필 이미지는 http(s) 주소 또는 업로드한 이미지 경로만 사용할 수 있습니다.")
+
+    await users_collection.update_one(
+        {"userid": userid},
+        {"$set": {"profile_image": profile_image, "profile_image_small": profile_image}}
+    )
+    return {"message": "프로필 이미지가 변경되었습니다."}
 
 # 관리자 권한 확인
 @app.get("/api/auth/check-admin")
@@ -430,14 +828,14 @@ async def reset_password(request: ResetPasswordRequest):
     """
 
     # 이메일 전송 시도
-    email_sent = send_email(request.email, subject, body)
+    email_sent = await asyncio.to_thread(send_email, request.email, subject, body)
 
     if not email_sent:
         # 이메일 전송 실패 시 비밀번호 변경하지 않고 에러 반환
         raise HTTPException(status_code=500, detail="이메일 전송에 실패했습니다. 잠시 후 다시 시도해주세요.")
 
     # 이메일 전송 성공 후에만 비밀번호 업데이트 및 임시 비밀번호 플래그 설정
-    hashed_password = get_password_hash(new_password)
+    hashed_password = await asyncio.to_thread(get_password_hash, new_password)
     await users_collection.update_one(
         {"userid": request.userid},
         {"$set": {"password": hashed_password, "is_temporary_password": True}}
@@ -454,11 +852,11 @@ async def change_password(request: ChangePasswordRequest, userid: str = Depends(
         raise HTTPException(status_code=404, detail="User not found")
 
     # 현재 비밀번호 확인
-    if not verify_password(request.current_password, user["password"]):
+    if not await asyncio.to_thread(verify_password, request.current_password, user["password"]):
         raise HTTPException(status_code=400, detail="현재 비밀번호가 일치하지 않습니다.")
 
     # 새 비밀번호 해싱 및 업데이트, 임시 비밀번호 플래그 해제
-    hashed_password = get_password_hash(request.new_password)
+    hashed_password = await asyncio.to_thread(get_password_hash, request.new_password)
     await users_collection.update_one(
         {"userid": userid},
         {"$set": {"password": hashed_password, "is_temporary_password": False}}
@@ -468,31 +866,69 @@ async def change_password(request: ChangePasswordRequest, userid: str = Depends(
 
 # 게시글 목록 조회
 @app.get("/api/posts")
-async def get_posts():
-    posts = []
-    async for post in posts_collection.find().sort("_id", -1):
-        posts.append(await post_helper(post))
-    return posts
+async def get_posts(
+    limit: int = Query(POST_PAGE_DEFAULT, ge=1, le=POST_PAGE_MAX),
+    before_id: Optional[str] = None
+):
+    # 최신순 키셋 페이지네이션 (before_id 보다 오래된 게시글을 limit 개)
+    query = {}
+    if before_id:
+        if not ObjectId.is_valid(before_id):
+            raise HTTPException(status_code=400, detail="Invalid before_id")
+        query["_id"] = {"$lt": ObjectId(before_id)}
+    posts = await posts_collection.find(query, POST_PROJECTION).sort("_id", -1).limit(limit).to_list(None)
+    post_ids = [str(post["_id"]) for post in posts]
+    counts = await get_comment_counts(post_ids)
+    return ORJSONResponse([
+        post_row(post, counts.get(post_id, 0))
+        for post, post_id in zip(posts, post_ids)
+    ])
+
+# 인기 게시글 (시간 감쇠 점수 순, /api/posts/{post_id} 보다 먼저 등록해야 함)
+@app.get("/api/posts/trending")
+async def get_trending_posts(limit: int = Query(10, ge=1, le=TRENDING_TOP_K)):
+    ranked = trending_tracker.top(limit)
+    post_ids = [post_id for post_id, _ in ranked]
+    posts = {}
+    async for post in posts_collection.find(
+        {"_id": {"$in": [ObjectId(post_id) for post_id in post_ids if ObjectId.is_valid(post_id)]}},
+        POST_PROJECTION
+    ):
+        posts[str(post["_id"])] = post
+    counts = await get_comment_counts(post_ids)
+
+    rows = []
+    for post_id, score in ranked:
+        post = posts.get(post_id)
+        if post is None:
+            continue
+        row = post_row(post, counts.get(post_id, 0))
+        row["trending_score"] = round(score, 3)
+        rows.append(row)
+    return ORJSONResponse(rows)
 
 # 게시글 상세 조회 (조회수 증가)
 @app.get("/api/posts/{post_id}")
 async def get_post(post_id: str):
-    post = await posts_collection.find_one({"_id": ObjectId(post_id)})
+    post = await posts_collection.find_one({"_id": ObjectId(post_id)}, POST_PROJECTION)
     if post:
         # 조회수 증가
         await posts_collection.update_one(
             {"_id": ObjectId(post_id)},
             {"$inc": {"views": 1}}
         )
-        post["views"] += 1
-        return await post_helper(post)
+        post["views"] = post.get("views", 0) + 1
+        trending_tracker.record(post_id, TRENDING_VIEW_WEIGHT)
+        return ORJSONResponse(await post_helper(post))
     raise HTTPException(status_code=404, detail="Post not found")
 
 # 게시글 작성
 @app.post("/api/posts")
 async def create_post(post: Post):
     post_dict = post.dict()
-    post_dict["date"] = datetime.now().strftime("%Y-%m-%d")
+    now = datetime.now()
+    post_dict["date"] = now.strftime(POST_DATE_FORMAT)
+    post_dict["created_at"] = now
     post_dict["views"] = 0
     result = await posts_collection.insert_one(post_dict)
     new_post = await posts_collection.find_one({"_id": result.inserted_id})
@@ -546,16 +982,51 @@ async def delete_post(
     if result.deleted_count:
         # 해당 게시글의 댓글도 모두 삭제
         await comments_collection.delete_many({"post_id": post_id})
+        # 인기 순위에서도 제거
+        trending_tracker.discard(post_id)
+        # 게임의 대표 게시글이었다면 다음 점수 저장 때 다시 찾음
+        game_name = game_name_from_path(existing_post.get("webgl_path"))
+        cached = game_canonical_posts.get(game_name)
+        if cached is not None and cached[0] == post_id:
+            del game_canonical_posts[game_name]
+        await trending_collection.delete_one({"_id": post_id})
         return {"message": "Post deleted successfully"}
     raise HTTPException(status_code=404, detail="Post not found")
 
-# 댓글 목록 조회
+# 댓글 목록 조회 (after_id 이후의 댓글을 limit 개수만큼, 키셋 페이지네이션)
 @app.get("/api/posts/{post_id}/comments")
-async def get_comments(post_id: str):
-    comments = []
-    async for comment in comments_collection.find({"post_id": post_id}).sort("_id", 1):
-        comments.append(comment_helper(comment))
-    return comments
+async def get_comments(
+    post_id: str,
+    limit: int = Query(COMMENT_PAGE_DEFAULT, ge=1, le=COMMENT_PAGE_MAX),
+    after_id: Optional[str] = None
+):
+    query = {"post_id": post_id}
+    if after_id:
+        if not ObjectId.is_valid(after_id):
+            raise HTTPException(status_code=400, detail="Invalid after_id")
+        query["_id"] = {"$gt": ObjectId(after_id)}
+
+    cursor = comments_collection.find(query, COMMENT_PROJECTION).sort("_id", 1).limit(limit)
+    return ORJSONResponse([comment_helper(comment) async for comment in cursor])
+
+# 여러 게시글의 첫 페이지 댓글 일괄 조회
+@app.get("/api/comments/batch")
+async def get_comments_batch(
+    post_ids: List[str] = Query(...),
+    limit: int = Query(20, ge=1, le=COMMENT_PAGE_MAX)
+):
+    if len(post_ids) > COMMENT_BATCH_MAX_POSTS:
+        raise HTTPException(status_code=400, detail=f"post_ids는 최대 {COMMENT_BATCH_MAX_POSTS}개까지 요청할 수 있습니다.")
+
+    # 게시글마다 (post_id, _id) 인덱스로 첫 limit 개만 읽음 (읽는 양이 댓글 총량이 아니라 limit 에 비례)
+    # 쿼리는 동시에 보내므로 대기 시간은 한 번의 조회와 비슷함
+    async def first_comments(post_id: str) -> list:
+        cursor = comments_collection.find({"post_id": post_id}, COMMENT_PROJECTION).sort("_id", 1).limit(limit)
+        return [comment_helper(comment) async for comment in cursor]
+
+    unique_ids = list(dict.fromkeys(post_ids))
+    pages = await asyncio.gather(*(first_comments(post_id) for post_id in unique_ids))
+    return ORJSONResponse(dict(zip(unique_ids, pages)))
 
 # 댓글 작성
 @app.post("/api/posts/{post_id}/comments")
@@ -565,13 +1036,16 @@ async def create_comment(post_id: str, comment: Comment):
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
 
+    now = datetime.now()
     comment_dict = {
         "post_id": post_id,
         "author": comment.author,
         "content": comment.content,
-        "date": datetime.now().strftime("%Y-%m-%d %H:%M")
+        "date": now.strftime(COMMENT_DATE_FORMAT),
+        "created_at": now
     }
     result = await comments_collection.insert_one(comment_dict)
+    trending_tracker.record(post_id, TRENDING_COMMENT_WEIGHT)
     new_comment = await comments_collection.find_one({"_id": result.inserted_id})
     return comment_helper(new_comment)
 
@@ -604,15 +1078,22 @@ async def save_score(score_data: GameScore, userid: str = Depends(get_current_us
     if score_data.username != userid:
         raise HTTPException(status_code=403, detail="본인의 점수만 저장할 수 있습니다.")
 
+    now = datetime.now()
     score_dict = {
         "game_name": score_data.game_name,
         "score": score_data.score,
         "username": score_data.username,
-        "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        "date": now.strftime(SCORE_DATE_FORMAT),
+        "created_at": now
     }
 
     result = await scores_collection.insert_one(score_dict)
 
+    # 이 게임의 대표 게시글 인기 점수 반영
+    post_id = await get_game_post_id(score_data.game_name)
+    if post_id:
+        trending_tracker.record(post_id, TRENDING_SCORE_WEIGHT)
+
     if result.inserted_id:
         return {"message": "Score saved successfully", "score_id": str(result.inserted_id)}
     raise HTTPException(status_code=500, detail="Failed to save score")
@@ -620,28 +1101,301 @@ async def save_score(score_data: GameScore, userid: str = Depends(get_current_us
 # 게임별 스코어보드 조회 (상위 10개)
 @app.get("/api/scores/{game_name}")
 async def get_scoreboard(game_name: str, limit: int = 10):
-    scores = []
-    async for score in scores_collection.find({"game_name": game_name}).sort("score", -1).limit(limit):
-        scores.append({
-            "id": str(score["_id"]),
-            "username": score["username"],
-            "score": score["score"],
-            "date": score["date"]
-        })
-    return scores
+    cursor = scores_collection.find({"game_name": game_name}, SCOREBOARD_PROJECTION).sort("score", -1).limit(limit)
+    rows = [scoreboard_row(score) async for score in cursor]
+
+    # 롤업된 과거 기록의 최고 점수도 함께 순위에 반영
+    cursor = score_summaries_collection.find({"game_name": game_name}, SUMMARY_PROJECTION).sort("best", -1).limit(limit)
+    rows.extend([summary_scoreboard_row(summary) async for summary in cursor])
+    rows.sort(key=lambda row: row["score"], reverse=True)
+    return ORJSONResponse(rows[:limit])
 
 # 사용자별 게임 스코어 조회
 @app.get("/api/scores/user/{username}")
 async def get_user_scores(username: str):
-    scores = []
-    async for score in scores_collection.find({"username": username}).sort("date", -1):
-        scores.append({
-            "id": str(score["_id"]),
-            "game_name": score["game_name"],
-            "score": score["score"],
-            "date": score["date"]
-        })
-    return scores
+    # 문자열 date 는 백필 전후 모든 문서에 있고 created_at 과 같은 순서이므로 (username, date) 인덱스 순서로 읽음
+    cursor = scores_collection.find({"username": username}, USER_SCORE_PROJECTION).sort("date", -1)
+    rows = [user_score_row(score) async for score in cursor]
+
+    # 보관 기간이 지나 요약된 기록은 게임별 요약 행으로 합침 (summary: True)
+    # 요약 행(게임 수만큼)만 정렬하고, 이미 정렬된 원본 행과 병합
+    summaries = []
+    async for summary in score_summaries_collection.find({"username": username}, SUMMARY_PROJECTION):
+        row = summary_user_score_row(summary)
+        row["summary"] = True
+        summaries.append(row)
+    summaries.sort(key=lambda row: row["date"], reverse=True)
+    return ORJSONResponse(list(heapq.merge(rows, summaries, key=lambda row: row["date"], reverse=True)))
+
+# 관리자용 데이터 내보내기 (NDJSON / CSV 스트리밍)
+# Motor 커서를 batch_size 단위로 읽으면서 바로 응답으로 흘려보내므로, 결과 크기와 상관없이 메모리 사용량이 일정함
+EXPORT_BATCH_SIZE = 2000
+# 한 번에 보낼 행 수 (행마다 yield 하면 오버헤드가 커서 묶어서 전송)
+EXPORT_FLUSH_ROWS = 500
+# 댓글을 게임으로 거를 때 한 번의 $in 에 넣는 게시글 수
+EXPORT_POST_CHUNK = 1000
+
+EXPORTS = {
+    # 종류: (컬렉션 이름, projection, 행 변환기, 작성자 필드)
+    "scores": ("scores", {"game_name": 1, "username": 1, "score": 1, "date": 1, "created_at": 1},
+               make_converter([
+                   ("game_name", "game_name", ""),
+                   ("username", "username", ""),
+                   ("score", "score", 0),
+                   ("date", "date", ""),
+               ], SCORE_DATE_FORMAT), "username"),
+    "posts": ("posts", POST_PROJECTION,
+              make_converter([
+                  ("title", "title", ""),
+                  ("author", "author", ""),
+                  ("content", "content", ""),
+                  ("category", "category", ""),
+                  ("webgl_path", "webgl_path", ""),
+                  ("date", "date", ""),
+                  ("views", "views", 0),
+              ], POST_DATE_FORMAT), "author"),
+    "comments": ("comments", COMMENT_PROJECTION,
+                 make_converter([
+                     ("post_id", "post_id", ""),
+                     ("author", "author", ""),
+                     ("content", "content", ""),
+                     ("date", "date", ""),
+                 ], COMMENT_DATE_FORMAT), "author"),
+}
+
+def parse_export_date(value: Optional[str], name: str) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"{name}는 YYYY-MM-DD 형식이어야 합니다.")
+
+# (조회 조건, 게시글 조건) 을 반환
+# 댓글을 게임으로 거르는 경우 게시글 id 를 미리 다 모으지 않고, 게시글 조건을 넘겨서
+# stream_export 가 게시글 id 를 EXPORT_POST_CHUNK 개씩 읽으며 댓글을 조회함
+def export_query(kind: str, game: Optional[str], user: Optional[str],
+                 start: Optional[datetime], end: Optional[datetime]):
+    _, _, _, user_field = EXPORTS[kind]
+    query = {}
+    post_query = None
+    if user:
+        query[user_field] = user
+    if game:
+        if kind == "scores":
+            query["game_name"] = game
+        elif kind == "posts":
+            query.update(game_path_query(game))
+        else:
+            post_query = game_path_query(game)
+
+    # end 는 해당 날짜를 포함 (다음 날 0시 미만)
+    # created_at 이 없는 문서(백필 전, 또는 created_at 없이 들어온 문서)는 문자열 date 로 비교
+    # ("%Y-%m-%d..." 형식은 사전순 == 시간순)
+    if start or end:
+        upper = end and end + timedelta(days=1)
+        created_at, date = {}, {}
+        if start:
+            created_at["$gte"] = start
+            date["$gte"] = start.strftime("%Y-%m-%d")
+        if upper:
+            created_at["$lt"] = upper
+            date["$lt"] = upper.strftime("%Y-%m-%d")
+        query["$or"] = [
+            {"created_at": created_at},
+            {"created_at": {"$exists": False}, "date": date},
+        ]
+    return query, post_query
+
+async def export_documents(collection, query: dict, projection: dict, post_query: Optional[dict]):
+    if post_query is None:
+        async for doc in collection.find(query, projection).batch_size(EXPORT_BATCH_SIZE):
+            yield doc
+        return
+
+    async def comments_of(post_ids):
+        chunk_query = {**query, "post_id": {"$in": post_ids}}
+        async for doc in collection.find(chunk_query, projection).batch_size(EXPORT_BATCH_SIZE):
+            yield doc
+
+    post_ids = []
+    async for post in posts_collection.find(post_query, {"_id": 1}).batch_size(EXPORT_POST_CHUNK):
+        post_ids.append(str(post["_id"]))
+        if len(post_ids) >= EXPORT_POST_CHUNK:
+            async for doc in comments_of(post_ids):
+                yield doc
+            post_ids = []
+    if post_ids:
+        async for doc in comments_of(post_ids):
+            yield doc
+
+async def stream_export(kind: str, query: dict, post_query: Optional[dict], fmt: str):
+    collection_name, projection, convert, _ = EXPORTS[kind]
+    cursor = export_documents(db[collection_name], query, projection, post_query)
+
+    if fmt == "ndjson":
+        lines = []
+        async for doc in cursor:
+            lines.append(orjson.dumps(convert(doc)))
+            if len(lines) >= EXPORT_FLUSH_ROWS:
+                yield b"\n".join(lines) + b"\n"
+                lines = []
+        if lines:
+            yield b"\n".join(lines) + b"\n"
+        return
+
+    buffer = io.StringIO()
+    # 결과가 없어도 헤더는 나가도록 변환기의 컬럼으로 먼저 씀
+    writer = csv.DictWriter(buffer, fieldnames=convert.columns)
+    writer.writeheader()
+    rows = 0
+    # Excel 에서 한글이 깨지지 않도록 BOM 추가
+    yield "\ufeff".encode("utf-8")
+    async for doc in cursor:
+        writer.writerow(convert(doc))
+        rows += 1
+        if rows % EXPORT_FLUSH_ROWS == 0:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+@app.get("/api/admin/export/{kind}")
+async def export_data(
+    kind: str,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    game: Optional[str] = None,
+    user: Optional[str] = None,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    # 관리자만 가능
+    if not is_admin(credentials):
+        raise HTTPException(status_code=403, detail="관리자만 내보낼 수 있습니다.")
+    if kind not in EXPORTS:
+        raise HTTPException(status_code=404, detail="scores, posts, comments 중 하나를 선택하세요.")
+
+    query, post_query = export_query(kind, game, user, parse_export_date(start, "start"), parse_export_date(end, "end"))
+    media_type = "application/x-ndjson" if format == "ndjson" else "text/csv; charset=utf-8"
+    filename = f"{kind}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.{format}"
+    return StreamingResponse(
+        stream_export(kind, query, post_query, format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+# 온디맨드 프로파일링
+# 세션은 요청을 받은 워커에서만 동작하고, 끝나면 결과를 profiles 컬렉션에 저장하므로
+# 내려받기는 어느 워커로 가도 된다.
+PROFILING_MAX_REQUESTS = 10000
+PROFILING_RECENT_LIMIT = 20
+PROFILE_SUMMARY_PROJECTION = {"folded": 0}
+
+class ProfilingStart(BaseModel):
+    route_pattern: str = ".*"   # 요청 경로에 대한 정규식 (예: "^/api/posts")
+    requests: int = 100         # 대상 요청 N 개를 처리하면 종료 (0 이면 시간으로만 종료)
+    seconds: float = 60         # 최대 시간 (최대 300초)
+    interval_ms: float = 5      # 샘플링 간격
+
+# 저장 태스크가 끝나기 전에 GC 되지 않도록 참조 유지
+profile_save_tasks = set()
+
+async def save_profile(session):
+    document = session.summary()
+    document["_id"] = document.pop("id")
+    document["started_at"] = session.started_at
+    document["finished_at"] = datetime.utcnow()
+    document["folded"] = session.folded()
+    try:
+        await db.profiles.insert_one(document)
+        print(f"[profiling] {session.id} saved: {session.completed} requests, {session.busy_samples} samples")
+    except Exception as e:
+        print(f"[profiling] {session.id} save failed: {e}")
+
+def on_profile_finished(session):
+    task = asyncio.get_running_loop().create_task(save_profile(session))
+    profile_save_tasks.add(task)
+    task.add_done_callback(profile_save_tasks.discard)
+
+@app.post("/api/admin/profiling")
+async def start_profiling(request: ProfilingStart, credentials: HTTPAuthorizationCredentials = Depends(security)):
+    # 관리자만 가능
+    if not is_admin(credentials):
+        raise HTTPException(status_code=403, detail="관리자만 프로파일링을 사용할 수 있습니다.")
+    if not 1 <= request.interval_ms <= 100:
+        raise HTTPException(status_code=400, detail="interval_ms 는 1~100 사이여야 합니다.")
+    if not 0 <= request.requests <= PROFILING_MAX_REQUESTS:
+        raise HTTPException(status_code=400, detail=f"requests 는 0~{PROFILING_MAX_REQUESTS} 사이여야 합니다.")
+    if not 0 < request.seconds <= profiling.MAX_SESSION_SECONDS:
+        raise HTTPException(status_code=400, detail=f"seconds 는 0~{profiling.MAX_SESSION_SECONDS} 사이여야 합니다.")
+    try:
+        re.compile(request.route_pattern)
+    except re.error as e:
+        raise HTTPException(status_code=400, detail=f"잘못된 route_pattern: {e}")
+
+    try:
+        session = profiling.start_session(
+            request.route_pattern, request.requests, request.seconds,
+            request.interval_ms / 1000, on_profile_finished
+        )
+    except RuntimeError:
+        raise HTTPException(status_code=409, detail="이미 진행 중인 프로파일링이 있습니다.")
+    # 대상 요청이 충분히 들어오지 않아도 시간이 지나면 종료하고 저장
+    asyncio.get_running_loop().call_later(session.seconds, profiling.finish_session, session)
+    return session.summary()
+
+@app.get("/api/admin/profiling")
+async def get_profiling_status(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    # 관리자만 가능
+    if not is_admin(credentials):
+        raise HTTPException(status_code=403, detail="관리자만 프로파일링을 사용할 수 있습니다.")
+    current = profiling.session
+    cursor = db.profiles.find({}, PROFILE_SUMMARY_PROJECTION).sort("started_at", -1).limit(PROFILING_RECENT_LIMIT)
+    recent = []
+    async for doc in cursor:
+        doc["id"] = doc.pop("_id")
+        doc["started_at"] = doc["started_at"].isoformat()
+        doc["finished_at"] = doc["finished_at"].isoformat()
+        recent.append(doc)
+    return {"current": current.summary() if current else None, "recent": recent}
+
+@app.delete("/api/admin/profiling")
+async def stop_profiling(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    # 관리자만 가능
+    if not is_admin(credentials):
+        raise HTTPException(status_code=403, detail="관리자만 프로파일링을 사용할 수 있습니다.")
+    current = profiling.session
+    if current is None:
+        raise HTTPException(status_code=404, detail="진행 중인 프로파일링이 없습니다.")
+    profiling.finish_session(current)
+    return current.summary()
+
+@app.get("/api/admin/profiling/{profile_id}")
+async def download_profile(profile_id: str, credentials: HTTPAuthorizationCredentials = Depends(security)):
+    # flamegraph.pl / speedscope 에서 바로 열 수 있는 folded stack 텍스트
+    # 관리자만 가능
+    if not is_admin(credentials):
+        raise HTTPException(status_code=403, detail="관리자만 프로파일링을 사용할 수 있습니다.")
+    doc = await db.profiles.find_one({"_id": profile_id}, {"folded": 1})
+    if doc is None:
+        raise HTTPException(status_code=404, detail="프로파일을 찾을 수 없습니다.")
+    return PlainTextResponse(
+        doc["folded"],
+        headers={"Content-Disposition": f'attachment; filename="profile-{profile_id}.folded"'}
+    )
+
+# 최근 이벤트 루프 stall (라우트, 지연 시간, 막혀 있던 동안의 스택)
+@app.get("/api/admin/loop-stalls")
+async def get_loop_stalls(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    # 관리자만 가능
+    if not is_admin(credentials):
+        raise HTTPException(status_code=403, detail="관리자만 조회할 수 있습니다.")
+    return {
+        "threshold_ms": LOOP_STALL_THRESHOLD_MS,
+        "stalls": list(reversed(loop_watchdog_monitor.recent)),
+    }
 
 if __name__ == "__main__":
     import uvicorn
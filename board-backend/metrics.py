@@ -0,0 +1,229 @@
+import asyncio
+import time
+import threading
+from bisect import bisect_left
+from contextvars import ContextVar
+
+from pymongo import monitoring
+
+# 라우트별 지연 시간 히스토그램 버킷 (초 단위, 미리 할당)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# 이벤트 루프 지연 히스토그램 버킷 (초 단위)
+LOOP_LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# 바이트 수를 집계할 정적 파일 경로
+STATIC_PREFIXES = ("/games", "/images")
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+# 요청 하나 동안 실행된 Mongo 명령 집계 ({명령 이름: [횟수, 누적 초]})
+class RequestStats:
+    __slots__ = ("commands",)
+
+    def __init__(self):
+        self.commands = {}
+
+    def add(self, command_name: str, seconds: float):
+        entry = self.commands.get(command_name)
+        if entry is None:
+            self.commands[command_name] = [1, seconds]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+
+
+_current_request = ContextVar("metrics_request", default=None)
+
+_lock = threading.Lock()
+request_latency = {}   # (method, route, status) -> Histogram
+mongo_commands = {}    # (route, command) -> [횟수, 누적 초]
+static_bytes = {}      # prefix -> 전송 바이트 수
+startup_phases = {}    # warm-up 단계 -> 소요 시간(초)
+event_loop_lag = Histogram(LOOP_LAG_BUCKETS)
+loop_stalls = {}       # route -> [횟수, 누적 초]
+# 처리 중인 요청 (task -> scope). 다른 스레드(loop_watchdog)가 막힌 루프의 라우트를 찾을 때 사용
+active_requests = {}
+
+
+def _add_mongo(route: str, command_name: str, count: int, seconds: float):
+    key = (route, command_name)
+    with _lock:
+        entry = mongo_commands.get(key)
+        if entry is None:
+            mongo_commands[key] = [count, seconds]
+        else:
+            entry[0] += count
+            entry[1] += seconds
+
+
+# Mongo 명령을 현재 처리 중인 요청에 귀속시키는 리스너
+# (Motor는 executor 스레드로 contextvars를 전달하므로 요청 컨텍스트를 그대로 읽을 수 있음)
+class MongoCommandListener(monitoring.CommandListener):
+    def started(self, event):
+        pass
+
+    def _finish(self, event):
+        seconds = event.duration_micros / 1_000_000
+        stats = _current_request.get()
+        if stats is None:
+            # 요청 밖에서 실행된 명령 (startup 등)
+            _add_mongo("", event.command_name, 1, seconds)
+        else:
+            stats.add(event.command_name, seconds)
+
+    def succeeded(self, event):
+        self._finish(event)
+
+    def failed(self, event):
+        self._finish(event)
+
+
+mongo_listener = MongoCommandListener()
+
+
+def add_loop_stall(route: str, seconds: float):
+    with _lock:
+        entry = loop_stalls.get(route)
+        if entry is None:
+            loop_stalls[route] = [1, seconds]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+
+
+def route_template(scope) -> str:
+    route = scope.get("route")
+    if route is not None:
+        return route.path
+    path = scope.get("path", "")
+    for prefix in STATIC_PREFIXES:
+        if path.startswith(prefix):
+            return prefix
+    return "unmatched"
+
+
+# 라우트 템플릿/상태 코드별 지연 시간과 Mongo 명령 수를 기록하는 ASGI 미들웨어
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        stats = RequestStats()
+        token = _current_request.set(stats)
+        task = asyncio.current_task()
+        active_requests[task] = scope
+        status_code = 500
+        static_prefix = None
+        for prefix in STATIC_PREFIXES:
+            if scope["path"].startswith(prefix):
+                static_prefix = prefix
+                break
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif static_prefix is not None and message["type"] == "http.response.body":
+                static_bytes[static_prefix] = static_bytes.get(static_prefix, 0) + len(message.get("body", b""))
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            _current_request.reset(token)
+            active_requests.pop(task, None)
+
+            route = route_template(scope)
+            key = (scope["method"], route, status_code)
+            histogram = request_latency.get(key)
+            if histogram is None:
+                histogram = request_latency[key] = Histogram()
+            histogram.observe(elapsed)
+
+            for command_name, (count, seconds) in stats.commands.items():
+                _add_mongo(route, command_name, count, seconds)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# Prometheus 텍스트 포맷으로 변환
+def render() -> str:
+    lines = [
+        "# HELP http_request_duration_seconds HTTP request latency by route template and status.",
+        "# TYPE http_request_duration_seconds histogram",
+    ]
+    for (method, route, status_code), histogram in list(request_latency.items()):
+        labels = f'method="{method}",route="{_escape(route)}",status="{status_code}"'
+        cumulative = 0
+        for bound, count in zip(histogram.buckets, histogram.counts):
+            cumulative += count
+            lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+        lines.append(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {histogram.count}')
+        lines.append(f"http_request_duration_seconds_sum{{{labels}}} {histogram.sum}")
+        lines.append(f"http_request_duration_seconds_count{{{labels}}} {histogram.count}")
+
+    lines.append("# HELP mongo_commands_total MongoDB commands issued, attributed to the route that issued them.")
+    lines.append("# TYPE mongo_commands_total counter")
+    with _lock:
+        mongo_snapshot = [(key, list(value)) for key, value in mongo_commands.items()]
+    for (route, command_name), (count, _) in mongo_snapshot:
+        lines.append(f'mongo_commands_total{{route="{_escape(route)}",command="{command_name}"}} {count}')
+    lines.append("# HELP mongo_command_seconds_total Time spent in MongoDB commands, attributed to the route that issued them.")
+    lines.append("# TYPE mongo_command_seconds_total counter")
+    for (route, command_name), (_, seconds) in mongo_snapshot:
+        lines.append(f'mongo_command_seconds_total{{route="{_escape(route)}",command="{command_name}"}} {seconds}')
+
+    lines.append("# HELP static_bytes_sent_total Bytes served from static mounts.")
+    lines.append("# TYPE static_bytes_sent_total counter")
+    for prefix, total in list(static_bytes.items()):
+        lines.append(f'static_bytes_sent_total{{mount="{prefix}"}} {total}')
+
+    lines.append("# HELP event_loop_lag_seconds How late the event loop heartbeat woke up.")
+    lines.append("# TYPE event_loop_lag_seconds histogram")
+    cumulative = 0
+    for bound, count in zip(event_loop_lag.buckets, event_loop_lag.counts):
+        cumulative += count
+        lines.append(f'event_loop_lag_seconds_bucket{{le="{bound}"}} {cumulative}')
+    lines.append(f'event_loop_lag_seconds_bucket{{le="+Inf"}} {event_loop_lag.count}')
+    lines.append(f"event_loop_lag_seconds_sum {event_loop_lag.sum}")
+    lines.append(f"event_loop_lag_seconds_count {event_loop_lag.count}")
+
+    lines.append("# HELP event_loop_stalls_total Event loop stalls over the watchdog threshold, by the route that was running.")
+    lines.append("# TYPE event_loop_stalls_total counter")
+    with _lock:
+        stall_snapshot = [(route, list(value)) for route, value in loop_stalls.items()]
+    for route, (count, _) in stall_snapshot:
+        lines.append(f'event_loop_stalls_total{{route="{_escape(route)}"}} {count}')
+    lines.append("# HELP event_loop_stall_seconds_total Time the event loop was blocked, by the route that was running.")
+    lines.append("# TYPE event_loop_stall_seconds_total counter")
+    for route, (_, seconds) in stall_snapshot:
+        lines.append(f'event_loop_stall_seconds_total{{route="{_escape(route)}"}} {seconds}')
+
+    lines.append("# HELP startup_phase_seconds Duration of each warm-up phase at worker startup.")
+    lines.append("# TYPE startup_phase_seconds gauge")
+    for phase, seconds in list(startup_phases.items()):
+        lines.append(f'startup_phase_seconds{{phase="{phase}"}} {seconds}')
+
+    return "\n".join(lines) + "\n"
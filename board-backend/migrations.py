@@ -0,0 +1,185 @@
+import argparse
+import asyncio
+import os
+import time
+from datetime import datetime
+
+from pymongo import UpdateOne
+
+from locks import acquire_lock, lock_owner, release_lock
+
+# 온라인 데이터 마이그레이션 (서버가 요청을 처리하는 동안 배치 단위로 조금씩 실행)
+#
+# - 각 마이그레이션은 _id 순서로 진행하고, 진행 상황(last_id)을 migrations 컬렉션에 저장한다.
+#   중간에 멈추거나 재시작해도 마지막 위치부터 이어서 실행한다.
+# - 배치 사이에 pause_seconds 만큼 쉬어서 운영 중인 DB 에 부하를 주지 않는다.
+# - 모든 배치를 마치면 {done: True} 로 표시되고, 서버는 이 값을 보고 새 필드만 읽도록 전환한다.
+
+LOCK_NAME = "migrations"
+
+# 기존 문자열 날짜 형식
+POST_DATE_FORMAT = "%Y-%m-%d"
+COMMENT_DATE_FORMAT = "%Y-%m-%d %H:%M"
+SCORE_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class Migration:
+    def __init__(self, name: str, collection: str, query: dict, projection: dict, transform):
+        self.name = name
+        self.collection = collection
+        # 아직 마이그레이션되지 않은 문서 조건
+        self.query = query
+        self.projection = projection
+        # 문서 -> $set 할 필드 (변환할 수 없으면 None)
+        self.transform = transform
+
+
+def _parse_date(date_format: str):
+    def transform(doc):
+        value = doc.get("date")
+        if not isinstance(value, str):
+            return None
+        try:
+            return {"created_at": datetime.strptime(value, date_format)}
+        except ValueError:
+            return None
+    return transform
+
+
+# 문자열 date -> BSON datetime created_at (기존 date 필드는 그대로 둠)
+MIGRATIONS = [
+    Migration("posts_created_at", "posts", {"created_at": {"$exists": False}}, {"date": 1},
+              _parse_date(POST_DATE_FORMAT)),
+    Migration("comments_created_at", "comments", {"created_at": {"$exists": False}}, {"date": 1},
+              _parse_date(COMMENT_DATE_FORMAT)),
+    Migration("scores_created_at", "scores", {"created_at": {"$exists": False}}, {"date": 1},
+              _parse_date(SCORE_DATE_FORMAT)),
+]
+
+
+async def completed_migrations(db) -> set:
+    return {doc["_id"] async for doc in db.migrations.find({"done": True}, {"_id": 1})}
+
+
+async def run_migration(db, migration: Migration, batch_size: int = 1000,
+                        pause_seconds: float = 0.1, max_batches: int = 0) -> dict:
+    state = await db.migrations.find_one({"_id": migration.name}) or {}
+    if state.get("done"):
+        return {"name": migration.name, "done": True, "migrated": state.get("migrated", 0)}
+
+    collection = db[migration.collection]
+    last_id = state.get("last_id")
+    migrated = state.get("migrated", 0)
+    skipped = state.get("skipped", 0)
+    batches = 0
+    done = False
+
+    while True:
+        query = dict(migration.query)
+        if last_id is not None:
+            query["_id"] = {"$gt": last_id}
+        rows = await collection.find(query, migration.projection).sort("_id", 1).limit(batch_size).to_list(None)
+        if not rows:
+            done = True
+            break
+
+        operations = []
+        for row in rows:
+            fields = migration.transform(row)
+            if fields is None:
+                skipped += 1
+                continue
+            # 그 사이 새 코드가 이미 필드를 채웠다면 덮어쓰지 않음
+            operations.append(UpdateOne({"_id": row["_id"], **migration.query}, {"$set": fields}))
+        if operations:
+            result = await collection.bulk_write(operations, ordered=False)
+            migrated += result.modified_count
+
+        last_id = rows[-1]["_id"]
+        batches += 1
+        await db.migrations.update_one(
+            {"_id": migration.name},
+            {"$set": {"last_id": last_id, "migrated": migrated, "skipped": skipped, "updated_at": datetime.utcnow()}},
+            upsert=True
+        )
+
+        if max_batches and batches >= max_batches:
+            break
+        await asyncio.sleep(pause_seconds)
+
+    if done:
+        await db.migrations.update_one(
+            {"_id": migration.name},
+            {"$set": {"done": True, "migrated": migrated, "skipped": skipped, "finished_at": datetime.utcnow()}},
+            upsert=True
+        )
+    return {"name": migration.name, "done": done, "batches": batches, "migrated": migrated, "skipped": skipped}
+
+
+async def run_all(db, batch_size: int = 1000, pause_seconds: float = 0.1, max_batches: int = 0) -> list:
+    results = []
+    for migration in MIGRATIONS:
+        start = time.perf_counter()
+        result = await run_migration(db, migration, batch_size, pause_seconds, max_batches)
+        result["seconds"] = round(time.perf_counter() - start, 2)
+        results.append(result)
+    return results
+
+
+# 서버 안에서 실행 (lifespan 백그라운드 태스크)
+# 잠금을 얻은 워커 하나만 마이그레이션을 실행하고, 나머지는 완료 여부만 주기적으로 확인한다.
+async def run_in_background(db, batch_size: int, pause_seconds: float, retry_seconds: float = 30):
+    owner = lock_owner()
+    while True:
+        try:
+            done = await completed_migrations(db)
+            if len(done) == len(MIGRATIONS):
+                return
+            if await acquire_lock(db.locks, LOCK_NAME, owner, lease_seconds=retry_seconds * 2):
+                try:
+                    for migration in MIGRATIONS:
+                        if migration.name in done:
+                            continue
+                        # 잠금이 만료되지 않도록 배치 묶음마다 갱신
+                        while True:
+                            result = await run_migration(db, migration, batch_size, pause_seconds, max_batches=20)
+                            await acquire_lock(db.locks, LOCK_NAME, owner, lease_seconds=retry_seconds * 2)
+                            if result["done"]:
+                                print(f"[migrations] {migration.name} done: {result}")
+                                break
+                finally:
+                    await release_lock(db.locks, LOCK_NAME, owner)
+                continue
+        except Exception as e:
+            print(f"[migrations] failed: {e}")
+        await asyncio.sleep(retry_seconds)
+
+
+def main():
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    parser = argparse.ArgumentParser(description="온라인 데이터 마이그레이션 실행")
+    parser.add_argument("--mongo-url", default=os.environ.get("MONGO_URL", "mongodb://localhost:27017"))
+    parser.add_argument("--db", default=os.environ.get("MONGO_DB", "board_database"))
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--pause", type=float, default=0.1, help="배치 사이 대기 시간(초)")
+    parser.add_argument("--max-batches", type=int, default=0, help="마이그레이션마다 실행할 최대 배치 수 (0 이면 끝까지)")
+    parser.add_argument("--status", action="store_true", help="진행 상황만 출력")
+    args = parser.parse_args()
+
+    async def run():
+        client = AsyncIOMotorClient(args.mongo_url)
+        db = client[args.db]
+        if args.status:
+            async for state in db.migrations.find():
+                print(state)
+        else:
+            for result in await run_all(db, args.batch_size, args.pause, args.max_batches):
+                print(result)
+        client.close()
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
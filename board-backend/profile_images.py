@@ -0,0 +1,166 @@
+import hashlib
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image, ImageOps
+from python_multipart.multipart import MultipartParseError, MultipartParser, parse_options_header
+
+# 프로필 이미지 업로드 처리
+#
+# 요청 본문(multipart)은 도착하는 대로 파싱해서 file 파트만 임시 파일에 쓰면서 sha256 을 계산하고
+# (전체를 메모리나 디스크에 미리 버퍼링하지 않음, 크기 제한도 받는 도중에 확인),
+# 검증/리사이즈는 별도 스레드 풀에서 실행한다 (Pillow 는 디코딩/리사이즈 중 GIL 을 놓음).
+# 결과는 원본 해시 기반 경로(content-addressed)에 저장되므로 같은 이미지는 한 번만 처리된다.
+#   static/images/profiles/ab/abcdef..._128.webp  ->  /images/profiles/ab/abcdef..._128.webp
+
+PROFILE_IMAGE_DIR = os.path.join("static", "images", "profiles")
+PROFILE_IMAGE_URL = "/images/profiles"
+PROFILE_IMAGE_MAX_BYTES = 5 * 1024 * 1024
+PROFILE_IMAGE_MAX_PIXELS = 40_000_000
+PROFILE_IMAGE_SIZES = {"small": 128, "large": 512}
+ALLOWED_FORMATS = {"JPEG", "PNG", "WEBP", "GIF"}
+# multipart 경계/헤더 등 file 파트 외의 본문 여유분
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+# 리사이즈(CPU)와 업로드 기록(디스크 I/O)은 서로 기다리지 않도록 풀을 나눔
+image_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="profile-image")
+upload_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="profile-upload")
+
+
+class InvalidImage(ValueError):
+    pass
+
+
+class ImageTooLarge(ValueError):
+    pass
+
+
+class UploadSpool:
+    # multipart 본문을 청크 단위로 받아서 field 이름의 파일 파트만 임시 파일에 기록
+    def __init__(self, content_type: str, field: str = "file", limit: int = PROFILE_IMAGE_MAX_BYTES):
+        media_type, options = parse_options_header(content_type)
+        boundary = options.get(b"boundary")
+        if media_type != b"multipart/form-data" or not boundary:
+            raise InvalidImage("multipart/form-data body required")
+        self.field = field.encode()
+        self.limit = limit
+        self.received = 0
+        self.size = 0
+        self.digest = hashlib.sha256()
+        self.tmp_path = None
+        self.out = None
+        self.done = False
+        self._header_field = b""
+        self._headers = {}
+        self.parser = MultipartParser(boundary, {
+            "on_part_begin": self._on_part_begin,
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_headers_finished": self._on_headers_finished,
+            "on_part_data": self._on_part_data,
+            "on_part_end": self._on_part_end,
+        })
+
+    def _on_part_begin(self):
+        self._headers = {}
+        self._header_field = b""
+
+    def _on_header_field(self, data, start, end):
+        self._header_field = data[start:end].lower()
+
+    def _on_header_value(self, data, start, end):
+        self._headers[self._header_field] = self._headers.get(self._header_field, b"") + data[start:end]
+
+    def _on_headers_finished(self):
+        _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+        if self.done or options.get(b"name") != self.field or b"filename" not in options:
+            return
+        tmp_dir = os.path.join(PROFILE_IMAGE_DIR, "tmp")
+        os.makedirs(tmp_dir, exist_ok=True)
+        self.tmp_path = os.path.join(tmp_dir, uuid.uuid4().hex)
+        self.out = open(self.tmp_path, "wb")
+
+    def _on_part_data(self, data, start, end):
+        if self.out is None:
+            return
+        self.size += end - start
+        if self.size > self.limit:
+            raise ImageTooLarge(f"image exceeds {self.limit} bytes")
+        chunk = data[start:end]
+        self.digest.update(chunk)
+        self.out.write(chunk)
+
+    def _on_part_end(self):
+        if self.out is not None:
+            self.out.close()
+            self.out = None
+            self.done = True
+
+    def write(self, chunk: bytes):
+        # 파일 이외의 파트로 본문을 키우는 요청도 막음
+        self.received += len(chunk)
+        if self.received > self.limit + MULTIPART_OVERHEAD_BYTES:
+            raise ImageTooLarge(f"body exceeds {self.limit} bytes")
+        try:
+            self.parser.write(chunk)
+        except MultipartParseError as e:
+            raise InvalidImage(str(e))
+
+    def finish(self):
+        # -> (임시 경로, sha256, 크기)
+        self.parser.finalize()
+        if not self.done:
+            raise InvalidImage(f"missing file field: {self.field.decode()}")
+        return self.tmp_path, self.digest.hexdigest(), self.size
+
+    def abort(self):
+        if self.out is not None:
+            self.out.close()
+            self.out = None
+        if self.tmp_path and os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+
+def variant_paths(digest: str) -> dict:
+    # {이름: (파일 경로, URL 경로)}
+    return {
+        name: (
+            os.path.join(PROFILE_IMAGE_DIR, digest[:2], f"{digest}_{size}.webp"),
+            f"{PROFILE_IMAGE_URL}/{digest[:2]}/{digest}_{size}.webp",
+        )
+        for name, size in PROFILE_IMAGE_SIZES.items()
+    }
+
+
+def store_variants(tmp_path: str, digest: str) -> dict:
+    # 검증 + 정사각형으로 잘라 크기별 WebP 저장 -> {이름: URL 경로}
+    paths = variant_paths(digest)
+    try:
+        if all(os.path.exists(path) for path, _ in paths.values()):
+            return {name: url for name, (_, url) in paths.items()}
+
+        try:
+            with Image.open(tmp_path) as image:
+                if image.format not in ALLOWED_FORMATS:
+                    raise InvalidImage(f"unsupported format: {image.format}")
+                if image.width * image.height > PROFILE_IMAGE_MAX_PIXELS:
+                    raise InvalidImage("image dimensions too large")
+                image.seek(0)
+                image = ImageOps.exif_transpose(image).convert("RGB")
+        except InvalidImage:
+            raise
+        except Exception as e:
+            raise InvalidImage(str(e))
+
+        os.makedirs(os.path.dirname(paths["large"][0]), exist_ok=True)
+        for name, size in PROFILE_IMAGE_SIZES.items():
+            path = paths[name][0]
+            resized = ImageOps.fit(image, (size, size), Image.LANCZOS)
+            # 다른 요청이 같은 파일을 읽는 중일 수 있으므로 임시 파일에 쓴 뒤 교체
+            partial = f"{path}.{uuid.uuid4().hex}.tmp"
+            resized.save(partial, "WEBP", quality=85)
+            os.replace(partial, path)
+        return {name: url for name, (_, url) in paths.items()}
+    finally:
+        os.remove(tmp_path)
@@ -0,0 +1,188 @@
+import os
+import re
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime
+
+# 관리자가 요청하는 온디맨드 샘플링 프로파일러
+#
+# - 세션이 없으면 미들웨어는 전역 변수 하나만 확인하고 그대로 통과 (샘플러 스레드도 없음)
+# - 세션이 켜지면 별도 스레드가 interval 마다 이벤트 루프 스레드의 스택을 읽는다 (sys._current_frames).
+#   대상 라우트의 요청이 처리 중일 때만 샘플을 남긴다.
+# - 루프가 select 에서 대기 중인 샘플은 idle, 나머지는 루프를 점유(blocking)한 샘플로 센다.
+#   busy 샘플 수 × interval 이 이벤트 루프 점유 시간의 추정치이고, busy 스택이 CPU 스택이다.
+# - 결과는 flamegraph.pl / speedscope 에서 읽을 수 있는 folded stack 형식("a;b;c 횟수")으로 만든다.
+#   모든 스택에 공통인 루프 바깥 프레임(run_forever -> _run_once -> Handle._run)은 떼어 내고,
+#   folded 전체 크기가 MAX_FOLDED_BYTES 를 넘으면 새 스택은 TRUNCATED_STACK 한 줄로 합친다
+#   (profiles 문서 하나가 MongoDB 문서 크기 제한 16MB 를 넘지 않도록).
+
+MAX_SESSION_SECONDS = 300
+MAX_STACK_DEPTH = 128
+MAX_FOLDED_BYTES = 8 * 1024 * 1024
+TRUNCATED_STACK = "[truncated]"
+
+# 루프가 이벤트를 기다리는 중인 프레임 (파일 이름, 함수 이름)
+IDLE_FRAMES = {
+    ("selectors.py", "select"),
+    ("base_events.py", "run_forever"),
+    ("base_events.py", "run_until_complete"),
+    ("runners.py", "run"),
+}
+# 여기서부터 바깥은 이벤트 루프 자체의 프레임 (스택에서 제외)
+LOOP_FRAMES = {
+    ("events.py", "_run"),
+}
+
+# 현재 진행 중인 세션 (없으면 None)
+session = None
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class ProfilingSession:
+    def __init__(self, route_pattern: str, max_requests: int, seconds: float, interval: float, on_finish):
+        self.id = uuid.uuid4().hex[:12]
+        self.route_pattern = route_pattern
+        self.route_regex = re.compile(route_pattern)
+        self.max_requests = max_requests
+        self.seconds = min(seconds, MAX_SESSION_SECONDS) if seconds else MAX_SESSION_SECONDS
+        self.interval = interval
+        self.on_finish = on_finish
+        self.started_at = datetime.utcnow()
+        self.deadline = time.monotonic() + self.seconds
+        self.loop_thread_id = threading.get_ident()
+
+        self.active = 0          # 처리 중인 대상 요청 수
+        self.started = 0         # 프로파일링을 시작한 요청 수
+        self.completed = 0
+        self.request_seconds = 0.0
+        self.busy_samples = 0
+        self.idle_samples = 0
+        self.stacks = {}         # folded stack -> 샘플 수
+        self.folded_bytes = 0
+        self.truncated_samples = 0
+        self.finished = False
+
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profiling-sampler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def matches(self, path: str) -> bool:
+        return (not self.finished and self.route_regex.search(path) is not None
+                and (not self.max_requests or self.started < self.max_requests))
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            if time.monotonic() >= self.deadline:
+                break
+            if self.active <= 0:
+                continue
+            frame = sys._current_frames().get(self.loop_thread_id)
+            if frame is None:
+                continue
+            code = frame.f_code
+            if (os.path.basename(code.co_filename), code.co_name) in IDLE_FRAMES:
+                self.idle_samples += 1
+                continue
+            labels = []
+            while frame is not None and len(labels) < MAX_STACK_DEPTH:
+                code = frame.f_code
+                if (os.path.basename(code.co_filename), code.co_name) in LOOP_FRAMES:
+                    break
+                labels.append(_frame_label(frame))
+                frame = frame.f_back
+            key = ";".join(reversed(labels))
+            if key not in self.stacks:
+                size = len(key.encode()) + 12   # " 횟수\n" 자리
+                if self.folded_bytes + size > MAX_FOLDED_BYTES:
+                    key = TRUNCATED_STACK
+                    self.truncated_samples += 1
+                else:
+                    self.folded_bytes += size
+            self.stacks[key] = self.stacks.get(key, 0) + 1
+            self.busy_samples += 1
+
+    # 이벤트 루프에서 호출되므로 join 하지 않음 (샘플러는 interval 안에 스스로 끝남)
+    # 그 사이 마지막 샘플이 하나 더 들어와도 folded() / summary() 는 그대로 동작
+    def stop(self):
+        self._stop.set()
+
+    def folded(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(self.stacks.items(), key=lambda item: -item[1]))
+
+    def summary(self) -> dict:
+        return {
+            "id": self.id,
+            "route_pattern": self.route_pattern,
+            "max_requests": self.max_requests,
+            "seconds": self.seconds,
+            "interval_ms": self.interval * 1000,
+            "started_at": self.started_at.isoformat(),
+            "finished": self.finished,
+            "requests": self.completed,
+            "request_seconds": round(self.request_seconds, 4),
+            "samples": self.busy_samples + self.idle_samples,
+            "busy_samples": self.busy_samples,
+            "idle_samples": self.idle_samples,
+            # 대상 요청이 처리되는 동안 이벤트 루프가 점유된 시간 추정치
+            "loop_blocking_ms": round(self.busy_samples * self.interval * 1000, 1),
+            "distinct_stacks": len(self.stacks),
+            # MAX_FOLDED_BYTES 를 넘겨서 TRUNCATED_STACK 으로 합쳐진 샘플 수
+            "truncated_samples": self.truncated_samples,
+        }
+
+
+def start_session(route_pattern: str, max_requests: int, seconds: float, interval: float, on_finish) -> ProfilingSession:
+    global session
+    if session is not None:
+        raise RuntimeError("profiling session already running")
+    session = ProfilingSession(route_pattern, max_requests, seconds, interval, on_finish)
+    session.start()
+    return session
+
+
+def finish_session(current: ProfilingSession):
+    global session
+    if current.finished:
+        return
+    current.finished = True
+    current.stop()
+    if session is current:
+        session = None
+    current.on_finish(current)
+
+
+class ProfilingMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        current = session
+        if current is None or scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        if time.monotonic() >= current.deadline:
+            finish_session(current)
+            return await self.app(scope, receive, send)
+        if not current.matches(scope["path"]):
+            return await self.app(scope, receive, send)
+
+        current.started += 1
+        current.active += 1
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current.active -= 1
+            current.completed += 1
+            current.request_seconds += time.perf_counter() - start
+            if current.max_requests and current.completed >= current.max_requests and current.active == 0:
+                finish_session(current)
@@ -0,0 +1,156 @@
+import argparse
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+from pymongo import UpdateOne
+
+from locks import acquire_lock, lock_owner, release_lock
+
+# 오래된 원본 점수(scores)를 사용자/게임별 요약(score_summaries)으로 합치고 원본은 배치 단위로 삭제
+#
+# 요약 문서: {username, game_name, best, best_date, count, last_played, last_rolled_id}
+# - 원본은 _id 순서로 처리하며, 요약마다 마지막으로 반영한 _id(last_rolled_id)를 저장한다.
+#   반영 후 삭제 전에 중단되어 같은 행을 다시 처리하더라도 count 가 중복으로 늘어나지 않는다.
+# - _id 에 생성 시각이 들어 있으므로 "N일보다 오래된 행"은 _id 범위 조건으로 인덱스만 타고 찾는다.
+
+LOCK_NAME = "score_rollup"
+
+
+def cutoff_id(older_than_days: float) -> ObjectId:
+    # ObjectId.from_datetime 은 naive datetime 을 UTC 로 취급
+    return ObjectId.from_datetime(datetime.utcnow() - timedelta(days=older_than_days))
+
+
+def _summary_update(key, rows, last_rolled_id):
+    username, game_name = key
+    # 이미 반영된 행(_id <= last_rolled_id)은 제외
+    if last_rolled_id is not None:
+        rows = [row for row in rows if row["_id"] > last_rolled_id]
+    if not rows:
+        return None
+
+    best_row = max(rows, key=lambda row: row["score"])
+    batch_best = best_row["score"]
+    batch_last = max(row["date"] for row in rows)
+    batch_max_id = max(row["_id"] for row in rows)
+
+    # 파이프라인 업데이트: 같은 $set 단계 안의 식은 모두 갱신 전 문서 값을 참조
+    pipeline = [{"$set": {
+        "username": username,
+        "game_name": game_name,
+        "best_date": {"$cond": [
+            {"$gt": [batch_best, {"$ifNull": ["$best", None]}]},
+            best_row["date"],
+            "$best_date",
+        ]},
+        "best": {"$max": ["$best", batch_best]},
+        "count": {"$add": [{"$ifNull": ["$count", 0]}, len(rows)]},
+        "last_played": {"$max": ["$last_played", batch_last]},
+        "last_rolled_id": batch_max_id,
+    }}]
+    return UpdateOne({"username": username, "game_name": game_name}, pipeline, upsert=True)
+
+
+async def rollup_scores(scores, summaries, older_than_days: float, batch_size: int = 1000,
+                        pause_seconds: float = 0.1, max_batches: int = 0) -> dict:
+    boundary = cutoff_id(older_than_days)
+    rolled = deleted = batches = 0
+    projection = {"username": 1, "game_name": 1, "score": 1, "date": 1}
+
+    while True:
+        rows = await scores.find({"_id": {"$lt": boundary}}, projection).sort("_id", 1).limit(batch_size).to_list(None)
+        if not rows:
+            break
+
+        groups = {}
+        for row in rows:
+            groups.setdefault((row["username"], row["game_name"]), []).append(row)
+
+        # 이번 배치에 해당하는 요약의 last_rolled_id 를 한 번에 조회
+        watermarks = {}
+        cursor = summaries.find(
+            {"username": {"$in": list({username for username, _ in groups})}},
+            {"username": 1, "game_name": 1, "last_rolled_id": 1}
+        )
+        async for summary in cursor:
+            watermarks[(summary["username"], summary["game_name"])] = summary.get("last_rolled_id")
+
+        operations = []
+        for key, group_rows in groups.items():
+            operation = _summary_update(key, group_rows, watermarks.get(key))
+            if operation is not None:
+                operations.append(operation)
+                rolled += len(group_rows)
+        if operations:
+            await summaries.bulk_write(operations, ordered=False)
+
+        result = await scores.delete_many({"_id": {"$in": [row["_id"] for row in rows]}})
+        deleted += result.deleted_count
+        batches += 1
+
+        if len(rows) < batch_size or (max_batches and batches >= max_batches):
+            break
+        # 운영 중인 DB 에 부하를 주지 않도록 배치 사이에 쉼
+        await asyncio.sleep(pause_seconds)
+
+    return {"batches": batches, "rolled_up": rolled, "deleted": deleted}
+
+
+# 잠금을 얻은 경우에만 한 번 롤업 (여러 워커 중 하나만 실행)
+async def rollup_once(db, owner: str, lease_seconds: float, older_than_days: float,
+                      batch_size: int, pause_seconds: float):
+    if not await acquire_lock(db.locks, LOCK_NAME, owner, lease_seconds=lease_seconds):
+        return None
+    try:
+        start = time.perf_counter()
+        stats = await rollup_scores(db.scores, db.score_summaries, older_than_days,
+                                    batch_size, pause_seconds)
+        if stats["batches"]:
+            print(f"[score-rollup] {stats} in {time.perf_counter() - start:.1f}s")
+        return stats
+    finally:
+        await release_lock(db.locks, LOCK_NAME, owner)
+
+
+# 서버 안에서 주기적으로 롤업 실행 (lifespan 에서 백그라운드 태스크로 시작)
+# 시작하자마자 한 번 시도한 뒤 interval 마다 반복
+# (먼저 기다리면 워커가 interval 보다 자주 재시작될 때 롤업이 한 번도 돌지 않음)
+async def run_periodically(db, interval_seconds: float, older_than_days: float,
+                           batch_size: int, pause_seconds: float):
+    owner = lock_owner()
+    while True:
+        try:
+            await rollup_once(db, owner, interval_seconds, older_than_days, batch_size, pause_seconds)
+        except Exception as e:
+            print(f"[score-rollup] failed: {e}")
+        await asyncio.sleep(interval_seconds)
+
+
+def main():
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    parser = argparse.ArgumentParser(description="오래된 점수 기록을 요약으로 합치고 삭제")
+    parser.add_argument("--mongo-url", default=os.environ.get("MONGO_URL", "mongodb://localhost:27017"))
+    parser.add_argument("--db", default=os.environ.get("MONGO_DB", "board_database"))
+    parser.add_argument("--older-than-days", type=float, default=90)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--pause", type=float, default=0.1, help="배치 사이 대기 시간(초)")
+    parser.add_argument("--max-batches", type=int, default=0, help="0 이면 끝까지 처리")
+    args = parser.parse_args()
+
+    async def run():
+        client = AsyncIOMotorClient(args.mongo_url)
+        db = client[args.db]
+        stats = await rollup_scores(db.scores, db.score_summaries, args.older_than_days,
+                                    args.batch_size, args.pause, args.max_batches)
+        print(stats)
+        client.close()
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
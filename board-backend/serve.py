@@ -0,0 +1,37 @@
+import argparse
+import os
+
+import uvicorn
+
+# 운영용 실행 스크립트 (멀티 워커)
+#   python serve.py --workers 4
+# 각 워커는 main.app 을 따로 import 하고, lifespan 에서 자신의 MongoDB 클라이언트를 만든다.
+# 풀 크기/타임아웃은 MONGO_MAX_POOL_SIZE, MONGO_MIN_POOL_SIZE, MONGO_*_TIMEOUT_MS 환경 변수로 설정.
+
+
+def main():
+    parser = argparse.ArgumentParser(description="게시판 백엔드 운영 서버")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="워커 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--graceful-timeout", type=int, default=30, help="종료 시 처리 중인 요청을 기다리는 최대 시간(초)")
+    parser.add_argument("--backlog", type=int, default=2048)
+    parser.add_argument("--keep-alive", type=int, default=5)
+    args = parser.parse_args()
+
+    # 워커가 여러 개면 import 문자열로 넘겨야 각 프로세스에서 앱을 새로 로드함
+    uvicorn.run(
+        "main:app",
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        lifespan="on",
+        backlog=args.backlog,
+        timeout_keep_alive=args.keep_alive,
+        timeout_graceful_shutdown=args.graceful_timeout,
+        access_log=False,
+    )
+
+
+if __name__ == "__main__":
+    main()
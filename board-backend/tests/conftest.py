@@ -0,0 +1,24 @@
+import os
+import sys
+
+import mongomock.collection
+import pytest
+from mongomock_motor import AsyncMongoMockClient
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 설치된 pymongo 는 UpdateOne 을 bulk_write 에 넘길 때 sort 인자를 붙이는데,
+# mongomock 4.3 의 BulkOperationBuilder.add_update 는 이 인자를 받지 않음 (테스트에서만 무시)
+_add_update = mongomock.collection.BulkOperationBuilder.add_update
+
+
+def _add_update_without_sort(self, *args, sort=None, **kwargs):
+    return _add_update(self, *args, **kwargs)
+
+
+mongomock.collection.BulkOperationBuilder.add_update = _add_update_without_sort
+
+
+@pytest.fixture
+def mongo_db():
+    return AsyncMongoMockClient()["board_test"]
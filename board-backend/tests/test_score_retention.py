@@ -0,0 +1,136 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+
+from locks import acquire_lock, release_lock
+from score_retention import LOCK_NAME, rollup_once, rollup_scores, run_periodically
+
+
+def old_id(days: float, seconds: int = 0) -> ObjectId:
+    return ObjectId.from_datetime(datetime.utcnow() - timedelta(days=days) + timedelta(seconds=seconds))
+
+
+def score_row(seconds: int, score: int, date: str, username: str = "alice", game_name: str = "watermelon",
+              days: float = 100) -> dict:
+    return {"_id": old_id(days, seconds), "username": username, "game_name": game_name,
+            "score": score, "date": date}
+
+
+ROWS = [
+    score_row(1, 300, "2024-01-01 10:00:00"),
+    score_row(2, 900, "2024-01-02 10:00:00"),
+    score_row(3, 500, "2024-01-03 10:00:00"),
+    score_row(4, 100, "2024-01-01 09:00:00", username="bob"),
+]
+
+
+def test_rollup_summarises_and_deletes_old_rows(mongo_db):
+    async def scenario():
+        recent = score_row(0, 50, "2099-01-01 00:00:00", days=1)
+        await mongo_db.scores.insert_many(ROWS + [recent])
+
+        stats = await rollup_scores(mongo_db.scores, mongo_db.score_summaries, 90, batch_size=2, pause_seconds=0)
+
+        assert stats == {"batches": 2, "rolled_up": 4, "deleted": 4}
+        assert [row["_id"] async for row in mongo_db.scores.find()] == [recent["_id"]]
+        alice = await mongo_db.score_summaries.find_one({"username": "alice"})
+        assert (alice["best"], alice["best_date"], alice["count"], alice["last_played"]) == (
+            900, "2024-01-02 10:00:00", 3, "2024-01-03 10:00:00")
+        assert alice["last_rolled_id"] == ROWS[2]["_id"]
+        bob = await mongo_db.score_summaries.find_one({"username": "bob"})
+        assert (bob["best"], bob["count"]) == (100, 1)
+
+    asyncio.run(scenario())
+
+
+def test_rerun_after_interrupted_delete_does_not_count_twice(mongo_db):
+    async def scenario():
+        await mongo_db.scores.insert_many(ROWS)
+        await rollup_scores(mongo_db.scores, mongo_db.score_summaries, 90, pause_seconds=0)
+        # 요약 반영 후 삭제 전에 중단된 경우: 같은 행이 다시 남아 있음
+        await mongo_db.scores.insert_many(ROWS)
+
+        stats = await rollup_scores(mongo_db.scores, mongo_db.score_summaries, 90, pause_seconds=0)
+
+        assert stats["rolled_up"] == 0 and stats["deleted"] == 4
+        alice = await mongo_db.score_summaries.find_one({"username": "alice"})
+        assert (alice["best"], alice["count"]) == (900, 3)
+
+    asyncio.run(scenario())
+
+
+def test_later_rollup_merges_best_date_and_last_played(mongo_db):
+    async def scenario():
+        await mongo_db.scores.insert_many(ROWS[:3])
+        await rollup_scores(mongo_db.scores, mongo_db.score_summaries, 90, pause_seconds=0)
+
+        # 더 낮은 최고 점수와 더 이른 날짜의 기록: best / best_date / last_played 는 그대로
+        await mongo_db.scores.insert_one(score_row(10, 400, "2023-12-31 10:00:00"))
+        await rollup_scores(mongo_db.scores, mongo_db.score_summaries, 90, pause_seconds=0)
+        alice = await mongo_db.score_summaries.find_one({"username": "alice"})
+        assert (alice["best"], alice["best_date"], alice["count"], alice["last_played"]) == (
+            900, "2024-01-02 10:00:00", 4, "2024-01-03 10:00:00")
+
+        # 더 높은 점수와 더 늦은 날짜의 기록: 모두 갱신
+        await mongo_db.scores.insert_one(score_row(20, 1200, "2024-02-01 10:00:00"))
+        await rollup_scores(mongo_db.scores, mongo_db.score_summaries, 90, pause_seconds=0)
+        alice = await mongo_db.score_summaries.find_one({"username": "alice"})
+        assert (alice["best"], alice["best_date"], alice["count"], alice["last_played"]) == (
+            1200, "2024-02-01 10:00:00", 5, "2024-02-01 10:00:00")
+
+    asyncio.run(scenario())
+
+
+def test_lock_is_held_by_one_owner_until_released(mongo_db):
+    async def scenario():
+        assert await acquire_lock(mongo_db.locks, LOCK_NAME, "worker-1", lease_seconds=60)
+        assert not await acquire_lock(mongo_db.locks, LOCK_NAME, "worker-2", lease_seconds=60)
+        # 같은 소유자는 다시 얻을 수 있음 (연장)
+        assert await acquire_lock(mongo_db.locks, LOCK_NAME, "worker-1", lease_seconds=60)
+        await release_lock(mongo_db.locks, LOCK_NAME, "worker-1")
+        assert await acquire_lock(mongo_db.locks, LOCK_NAME, "worker-2", lease_seconds=60)
+
+    asyncio.run(scenario())
+
+
+def test_expired_lock_can_be_taken_over(mongo_db):
+    async def scenario():
+        await mongo_db.locks.insert_one({"_id": LOCK_NAME, "owner": "crashed",
+                                         "expires_at": datetime.utcnow() - timedelta(seconds=1)})
+        assert await acquire_lock(mongo_db.locks, LOCK_NAME, "worker-1", lease_seconds=60)
+        assert (await mongo_db.locks.find_one({"_id": LOCK_NAME}))["owner"] == "worker-1"
+
+    asyncio.run(scenario())
+
+
+def test_rollup_once_skips_while_another_worker_holds_the_lock(mongo_db):
+    async def scenario():
+        await mongo_db.scores.insert_many(ROWS)
+        await acquire_lock(mongo_db.locks, LOCK_NAME, "other", lease_seconds=60)
+        assert await rollup_once(mongo_db, "me", 60, 90, 1000, 0) is None
+        assert await mongo_db.scores.count_documents({}) == 4
+
+        await release_lock(mongo_db.locks, LOCK_NAME, "other")
+        stats = await rollup_once(mongo_db, "me", 60, 90, 1000, 0)
+        assert stats["deleted"] == 4
+        # 끝나면 잠금을 풀어 둠
+        assert await mongo_db.locks.find_one({"_id": LOCK_NAME}) is None
+
+    asyncio.run(scenario())
+
+
+def test_periodic_rollup_runs_once_at_startup(mongo_db):
+    async def scenario():
+        await mongo_db.scores.insert_many(ROWS)
+        task = asyncio.create_task(run_periodically(mongo_db, 3600, 90, 1000, 0))
+        for _ in range(100):
+            if await mongo_db.scores.count_documents({}) == 0:
+                break
+            await asyncio.sleep(0.01)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        assert await mongo_db.scores.count_documents({}) == 0
+        assert await mongo_db.score_summaries.count_documents({}) == 2
+
+    asyncio.run(scenario())
@@ -0,0 +1,111 @@
+import asyncio
+
+from trending import EPOCH_SECONDS, TrendingTracker
+
+
+# find() 결과를 읽기 전에 멈춰 두는 컬렉션 (동기화 도중의 상태를 보기 위해)
+class PausedFind:
+    def __init__(self, collection):
+        self.collection = collection
+        self.reading = asyncio.Event()
+        self.resume = asyncio.Event()
+
+    def __getattr__(self, name):
+        return getattr(self.collection, name)
+
+    def find(self, *args, **kwargs):
+        return PausedCursor(self, self.collection.find(*args, **kwargs))
+
+
+class PausedCursor:
+    def __init__(self, owner, cursor):
+        self.owner = owner
+        self.cursor = cursor
+
+    def sort(self, *args, **kwargs):
+        self.cursor = self.cursor.sort(*args, **kwargs)
+        return self
+
+    def limit(self, *args, **kwargs):
+        self.cursor = self.cursor.limit(*args, **kwargs)
+        return self
+
+    async def __aiter__(self):
+        self.owner.reading.set()
+        await self.owner.resume.wait()
+        async for doc in self.cursor:
+            yield doc
+
+
+def test_first_sync_rescales_documents_from_an_older_epoch(mongo_db):
+    collection = mongo_db.trending
+    tracker = TrendingTracker(half_life_seconds=EPOCH_SECONDS)
+    now = tracker.epoch + 10
+    # 이전 epoch 에 저장된 점수 (재시작 전 프로세스가 남긴 것)
+    asyncio.run(collection.insert_one({"_id": "p1", "score": 100.0, "epoch": tracker.epoch - EPOCH_SECONDS}))
+
+    asyncio.run(tracker.sync(collection, now=now))
+
+    doc = asyncio.run(collection.find_one({"_id": "p1"}))
+    assert doc["epoch"] == tracker.epoch
+    assert abs(doc["score"] - 50.0) < 1e-6
+    assert [post_id for post_id, _ in tracker.top(10, now=tracker.epoch)] == ["p1"]
+
+
+def test_first_sync_prunes_documents_decayed_below_threshold(mongo_db):
+    collection = mongo_db.trending
+    tracker = TrendingTracker(half_life_seconds=3600)
+    asyncio.run(collection.insert_one({"_id": "old", "score": 1.0, "epoch": tracker.epoch - EPOCH_SECONDS}))
+
+    asyncio.run(tracker.sync(collection, now=tracker.epoch + 10))
+
+    assert asyncio.run(collection.count_documents({})) == 0
+    assert tracker.top(10) == []
+
+
+def test_ranking_stays_visible_while_sync_reloads(mongo_db):
+    async def scenario():
+        collection = mongo_db.trending
+        tracker = TrendingTracker(half_life_seconds=EPOCH_SECONDS)
+        now = tracker.epoch
+        tracker.record("p1", 10, now=now)
+        tracker.record("p2", 5, now=now)
+        await tracker.sync(collection, now=now)
+
+        paused = PausedFind(collection)
+        sync = asyncio.create_task(tracker.sync(paused, now=now))
+        await paused.reading.wait()
+
+        # 다시 읽는 동안에도 이전 순위가 그대로 보이고, 새 증가분은 pending 에 남음
+        assert [post_id for post_id, _ in tracker.top(10, now=now)] == ["p1", "p2"]
+        tracker.record("p3", 20, now=now)
+        tracker.record("p1", 1, now=now)
+
+        paused.resume.set()
+        await sync
+        assert [(post_id, round(score, 6)) for post_id, score in tracker.top(10, now=now)] == [
+            ("p3", 20.0), ("p1", 11.0), ("p2", 5.0),
+        ]
+        assert tracker.pending == {"p3": 20.0, "p1": 1.0}
+
+        # 다음 동기화에서 저장되고, 두 번 더해지지 않음
+        await tracker.sync(collection, now=now)
+        assert tracker.pending == {}
+        assert [(post_id, round(score, 6)) for post_id, score in tracker.top(10, now=now)] == [
+            ("p3", 20.0), ("p1", 11.0), ("p2", 5.0),
+        ]
+
+    asyncio.run(scenario())
+
+
+def test_reload_keeps_only_top_k(mongo_db):
+    async def scenario():
+        tracker = TrendingTracker(half_life_seconds=EPOCH_SECONDS, k=2)
+        now = tracker.epoch
+        for post_id, amount in (("a", 1), ("b", 3), ("c", 2)):
+            tracker.record(post_id, amount, now=now)
+        await tracker.sync(mongo_db.trending, now=now)
+        assert [post_id for post_id, _ in tracker.top(10, now=now)] == ["b", "c"]
+        assert set(tracker.scores) == {"b", "c"}
+
+    asyncio.run(scenario())
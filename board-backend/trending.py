@@ -0,0 +1,131 @@
+import math
+import time
+from bisect import bisect_left, insort
+
+from pymongo import UpdateOne
+
+# 시간 감쇠 인기 점수 (조회 / 댓글 / 연결된 게임의 점수 기록)
+#
+# 점수 = Σ 가중치 × exp(decay × (발생 시각 - 기준 시각))
+# 모든 게시글이 같은 비율로 감쇠하므로, 기준 시각을 고정해 두면 감쇠가 순위를 바꾸지 않는다.
+# 따라서 이벤트가 들어올 때 해당 게시글만 갱신하면 top-K 가 항상 정확하게 유지되고,
+# 현재 점수가 필요할 때만 exp(decay × (지금 - 기준 시각)) 로 나눈다.
+# 값이 너무 커지지 않도록 기준 시각(epoch)은 EPOCH_SECONDS 마다 앞으로 옮기고 저장된 점수도 다시 맞춘다.
+# (재시작한 워커는 이전 epoch 로 저장된 문서를 모르므로, 프로세스의 첫 동기화에서도 저장된 점수를 맞춘다)
+#
+# 워커마다 들어온 증가분(pending)은 주기적으로 Mongo 의 trending 컬렉션({_id: post_id, score, epoch})에
+# 합쳐지고, 합쳐진 전체 상위 K 개를 다시 읽어 온다. 재시작 후에도, 워커가 여러 개여도 같은 순위를 보게 된다.
+
+EPOCH_SECONDS = 7 * 24 * 3600
+# 이 값보다 작아진 (현재 기준) 점수는 저장소에서 정리
+PRUNE_BELOW = 0.01
+
+
+class TrendingTracker:
+    def __init__(self, half_life_seconds: float = 24 * 3600, k: int = 100):
+        self.decay = math.log(2) / half_life_seconds
+        self.k = k
+        self.epoch = self._epoch_at(time.time())
+        self.stored_epoch = None   # 저장된 문서를 이 epoch 로 맞춰 두었음
+        self.pending = {}    # 마지막 동기화 이후 증가분
+        self.scores = {}     # top-K: post_id -> 점수 (epoch 기준 단위)
+        self.ranking = []    # [(-점수, post_id)] 오름차순 == 점수 내림차순
+
+    @staticmethod
+    def _epoch_at(now: float) -> int:
+        return int(now // EPOCH_SECONDS) * EPOCH_SECONDS
+
+    def _weight(self, now: float) -> float:
+        return math.exp(self.decay * (now - self.epoch))
+
+    def _remove(self, post_id: str):
+        score = self.scores.pop(post_id)
+        index = bisect_left(self.ranking, (-score, post_id))
+        del self.ranking[index]
+
+    def _set(self, post_id: str, score: float):
+        if post_id in self.scores:
+            self._remove(post_id)
+        self.scores[post_id] = score
+        insort(self.ranking, (-score, post_id))
+        if len(self.ranking) > self.k:
+            _, dropped = self.ranking.pop()
+            del self.scores[dropped]
+
+    def record(self, post_id: str, amount: float, now: float = None):
+        value = amount * self._weight(now or time.time())
+        self.pending[post_id] = self.pending.get(post_id, 0.0) + value
+
+        # top-K 밖의 게시글은 전체 점수를 모르므로 이번 증가분만으로 진입 여부 판단 (다음 동기화에서 보정)
+        score = self.scores.get(post_id, 0.0) + value
+        if post_id in self.scores or len(self.ranking) < self.k or score > -self.ranking[-1][0]:
+            self._set(post_id, score)
+
+    def discard(self, post_id: str):
+        self.pending.pop(post_id, None)
+        if post_id in self.scores:
+            self._remove(post_id)
+
+    def top(self, limit: int, now: float = None) -> list:
+        # [(post_id, 현재 점수)], O(limit)
+        weight = self._weight(now or time.time())
+        return [(post_id, -negative / weight) for negative, post_id in self.ranking[:limit]]
+
+    def _rescale_expression(self, field: str):
+        # epoch 가 다른 문서의 값을 현재 epoch 기준으로 환산
+        return {"$multiply": [
+            {"$ifNull": [field, 0]},
+            {"$exp": {"$multiply": [-self.decay, {"$subtract": [self.epoch, {"$ifNull": ["$epoch", self.epoch]}]}]}},
+        ]}
+
+    async def sync(self, collection, now: float = None):
+        now = now or time.time()
+
+        # 기준 시각 이동: 메모리 값을 환산
+        epoch = self._epoch_at(now)
+        if epoch != self.epoch:
+            factor = math.exp(-self.decay * (epoch - self.epoch))
+            self.pending = {post_id: value * factor for post_id, value in self.pending.items()}
+            self.epoch = epoch
+        # 저장된 문서도 현재 epoch 로 환산한 뒤 작아진 점수는 정리
+        # (epoch 가 바뀌었을 때와, 이전 epoch 의 문서가 남아 있을 수 있는 첫 동기화 때)
+        if self.stored_epoch != epoch:
+            await collection.update_many(
+                {"epoch": {"$lt": epoch}},
+                [{"$set": {"score": self._rescale_expression("$score"), "epoch": epoch}}]
+            )
+            await collection.delete_many({"score": {"$lt": PRUNE_BELOW}})
+            self.stored_epoch = epoch
+
+        # 증가분 반영 (실패하면 다음 동기화 때 다시 시도)
+        pending, self.pending = self.pending, {}
+        if pending:
+            operations = [
+                UpdateOne(
+                    {"_id": post_id},
+                    [{"$set": {
+                        "score": {"$add": [self._rescale_expression("$score"), value]},
+                        "epoch": self.epoch,
+                    }}],
+                    upsert=True
+                )
+                for post_id, value in pending.items()
+            ]
+            try:
+                await collection.bulk_write(operations, ordered=False)
+            except Exception:
+                for post_id, value in pending.items():
+                    self.pending[post_id] = self.pending.get(post_id, 0.0) + value
+                raise
+
+        # 전체 상위 K 개를 다시 읽어서 교체
+        # 읽는 동안에는 기존 순위를 그대로 보여 주고, 다 읽은 뒤 await 없이 한 번에 바꿈
+        # (읽는 동안 들어온 증가분은 아직 저장되지 않았으므로 pending 에서 다시 더함)
+        cursor = collection.find({"epoch": self.epoch}, {"score": 1}).sort("score", -1).limit(self.k)
+        stored = [(doc["_id"], doc["score"]) async for doc in cursor]
+        scores = dict(stored)
+        for post_id, value in self.pending.items():
+            scores[post_id] = scores.get(post_id, 0.0) + value
+        ranking = sorted((-score, post_id) for post_id, score in scores.items())[:self.k]
+        self.scores = {post_id: -negative for negative, post_id in ranking}
+        self.ranking = ranking
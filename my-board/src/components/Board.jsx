@@ -2,18 +2,26 @@ import { useState, useEffect } from 'react';
 import { useParams, useNavigate } from 'react-router-dom';
 
 const API_URL = 'http://localhost:8000/api';
+// 댓글 한 페이지 크기 (백엔드 COMMENT_PAGE_MAX 이하)
+const COMMENT_PAGE_SIZE = 50;
+// 게시글 목록 한 페이지 크기 (백엔드 POST_PAGE_MAX 이하)
+const POST_PAGE_SIZE = 100;
 
 export default function Board({ user, isAdmin = false, onLogout }) {
   const { postId } = useParams();
   const navigate = useNavigate();
 
   const [posts, setPosts] = useState([]);
+  const [hasMorePosts, setHasMorePosts] = useState(false);
   const [view, setView] = useState('list');
   const [selectedPost, setSelectedPost] = useState(null);
   const [formData, setFormData] = useState({ title: '', content: '', category: 'Unity 게임', webgl_path: '' });
   const [editMode, setEditMode] = useState(false);
   const [loading, setLoading] = useState(false);
   const [comments, setComments] = useState([]);
+  const [hasMoreComments, setHasMoreComments] = useState(false);
+  // 서버에서 마지막으로 받은 댓글 id (방금 작성한 댓글은 목록 끝에 붙이지만 페이지 위치에는 영향 없음)
+  const [commentCursor, setCommentCursor] = useState(null);
   const [commentContent, setCommentContent] = useState('');
   const [profileImage, setProfileImage] = useState('/images/profile.jpg');
   const [selectedCategory, setSelectedCategory] = useState('전체');
@@ -65,15 +73,7 @@ export default function Board({ user, isAdmin = false, onLogout }) {
             setView('detail');
 
             // 댓글 불러오기
-            try {
-              const commentsResponse = await fetch(`${API_URL}/posts/${postId}/comments`);
-              if (commentsResponse.ok) {
-                const commentsData = await commentsResponse.json();
-                setComments(commentsData);
-              }
-            } catch (error) {
-              console.error('댓글 불러오기 실패:', error);
-            }
+            fetchComments(postId);
           } else {
             // 게시물이 없으면 목록으로
             navigate('/');
@@ -121,9 +121,10 @@ export default function Board({ user, isAdmin = false, onLogout }) {
   const fetchPosts = async () => {
     try {
       setLoading(true);
-      const response = await fetch(`${API_URL}/posts`);
+      const response = await fetch(`${API_URL}/posts?limit=${POST_PAGE_SIZE}`);
       const data = await response.json();
       setPosts(data);
+      setHasMorePosts(data.length === POST_PAGE_SIZE);
     } catch (error) {
       console.error('게시글 목록 불러오기 실패:', error);
       alert('게시글을 불러오는데 실패했습니다.');
@@ -132,6 +133,20 @@ export default function Board({ user, isAdmin = false, onLogout }) {
     }
   };
 
+  // 마지막 게시글보다 오래된 다음 페이지를 이어 붙임
+  const loadMorePosts = async () => {
+    if (posts.length === 0) return;
+    try {
+      const params = new URLSearchParams({ limit: POST_PAGE_SIZE, before_id: posts[posts.length - 1].id });
+      const response = await fetch(`${API_URL}/posts?${params}`);
+      const data = await response.json();
+      setPosts(prev => [...prev, ...data]);
+      setHasMorePosts(data.length === POST_PAGE_SIZE);
+    } catch (error) {
+      console.error('게시글 목록 불러오기 실패:', error);
+    }
+  };
+
   const handlePostClick = async (post) => {
     try {
       const response = await fetch(`${API_URL}/posts/${post.id}`);
@@ -152,16 +167,34 @@ export default function Board({ user, isAdmin = false, onLogout }) {
     }
   };
 
-  const fetchComments = async (postId) => {
+  // 댓글은 COMMENT_PAGE_SIZE 개씩 불러옴 (afterId 가 있으면 그 다음 페이지를 이어 붙임)
+  // 이어 붙일 때는 이미 화면에 있는 댓글(방금 작성한 댓글 등)은 건너뛰고 id(ObjectId, 작성 순) 순서로 정렬
+  const fetchComments = async (postId, afterId = null) => {
     try {
-      const response = await fetch(`${API_URL}/posts/${postId}/comments`);
+      const params = new URLSearchParams({ limit: COMMENT_PAGE_SIZE });
+      if (afterId) params.set('after_id', afterId);
+      const response = await fetch(`${API_URL}/posts/${postId}/comments?${params}`);
+      if (!response.ok) return;
       const data = await response.json();
-      setComments(data);
+      setComments(prev => {
+        if (!afterId) return data;
+        const shown = new Set(prev.map(comment => comment.id));
+        return [...prev, ...data.filter(comment => !shown.has(comment.id))]
+          .sort((a, b) => (a.id < b.id ? -1 : a.id > b.id ? 1 : 0));
+      });
+      if (data.length > 0) setCommentCursor(data[data.length - 1].id);
+      else if (!afterId) setCommentCursor(null);
+      setHasMoreComments(data.length === COMMENT_PAGE_SIZE);
     } catch (error) {
       console.error('댓글 불러오기 실패:', error);
     }
   };
 
+  const loadMoreComments = () => {
+    if (!commentCursor) return;
+    fetchComments(selectedPost.id, commentCursor);
+  };
+
   const handleCommentSubmit = async (e) => {
     e.preventDefault();
     if (!commentContent.trim()) return;
@@ -179,8 +212,11 @@ export default function Board({ user, isAdmin = false, onLogout }) {
       });
 
       if (response.ok) {
+        // 첫 페이지를 다시 불러오면 댓글이 많은 글에서는 방금 쓴 댓글이 안 보이므로 목록 끝에 바로 붙임
+        const newComment = await response.json();
         setCommentContent('');
-        fetchComments(selectedPost.id);
+        setComments(prev => [...prev, newComment]);
+        setSelectedPost(prev => ({ ...prev, comment_count: (prev.comment_count || 0) + 1 }));
         fetchPosts(); // 댓글 수 업데이트
       } else {
         alert('댓글 작성에 실패했습니다.');
@@ -203,7 +239,9 @@ export default function Board({ user, isAdmin = false, onLogout }) {
         });
 
         if (response.ok) {
-          fetchComments(selectedPost.id);
+          // 불러온 페이지는 그대로 두고 삭제한 댓글만 뺌
+          setComments(prev => prev.filter(comment => comment.id !== commentId));
+          setSelectedPost(prev => ({ ...prev, comment_count: Math.max((prev.comment_count || 0) - 1, 0) }));
           fetchPosts(); // 댓글 수 업데이트
         } else {
           alert('댓글 삭제에 실패했습니다.');
@@ -414,7 +452,7 @@ export default function Board({ user, isAdmin = false, onLogout }) {
               <span>작성자: {selectedPost.author}</span>
               <span>작성일: {selectedPost.date}</span>
               <span>조회수: {selectedPost.views}</span>
-              <span>댓글: {comments.length}</span>
+              <span>댓글: {selectedPost.comment_count ?? comments.length}</span>
             </div>
           </div>
 
@@ -466,7 +504,7 @@ export default function Board({ user, isAdmin = false, onLogout }) {
 
           {/* 댓글 섹션 */}
           <div className="border-t border-gray-200 px-8 py-6">
-            <h3 className="text-xl font-bold text-gray-800 mb-4">댓글 {comments.length}개</h3>
+            <h3 className="text-xl font-bold text-gray-800 mb-4">댓글 {selectedPost.comment_count ?? comments.length}개</h3>
 
             {/* 댓글 작성 폼 */}
             <form onSubmit={handleCommentSubmit} className="mb-6">
@@ -513,6 +551,16 @@ export default function Board({ user, isAdmin = false, onLogout }) {
                 ))
               )}
             </div>
+            {hasMoreComments && (
+              <div className="flex justify-center mt-4">
+                <button
+                  onClick={loadMoreComments}
+                  className="px-6 py-2 border border-gray-300 text-gray-700 rounded hover:bg-gray-50 text-base"
+                >
+                  댓글 더보기
+                </button>
+              </div>
+            )}
           </div>
 
           <div className="border-t border-gray-200 px-8 py-6 flex gap-2">
@@ -700,6 +748,16 @@ export default function Board({ user, isAdmin = false, onLogout }) {
                 );
               })
             )}
+            {hasMorePosts && (
+              <div className="flex justify-center">
+                <button
+                  onClick={loadMorePosts}
+                  className="px-8 py-3 border border-gray-300 text-gray-700 rounded-xl hover:bg-gray-50 text-base font-medium"
+                >
+                  게시글 더보기
+                </button>
+              </div>
+            )}
           </div>
         )}
       </div>